@@ -0,0 +1,35 @@
+"""Shared prompt assembly for the agent pipeline.
+
+Inference engines (Ollama, vLLM) cache the prefill KV state keyed on the
+longest common prompt prefix. That only pays off when the static part of a
+prompt — role instructions, output format, focus lists — comes first and
+byte-identical on every call, with the per-call data appended at the end.
+Agents should route their prompts through build_prompt with a module-level
+constant as the static half so the layout can't drift back to dynamic-first.
+"""
+
+from functools import lru_cache
+
+SEPARATOR = "\n\n"
+
+
+@lru_cache(maxsize=None)
+def load_prompt_file(path: str) -> str:
+    """Read and cache an agent system prompt.
+
+    System prompts are static for the process lifetime; reading the file once
+    instead of per call keeps the retry loops and batched calls off the disk.
+    A missing file raises FileNotFoundError (not cached), so callers keep
+    their existing error handling.
+    """
+    with open(path, "r") as f:
+        return f.read()
+
+
+def build_prompt(system_static: str, user_dynamic: str) -> str:
+    """Compose a prompt as [static instructions][separator][dynamic input].
+
+    Keep `system_static` a module-level constant: any per-call variation in
+    the static half collapses the engine's prefix-cache hit rate.
+    """
+    return f"{system_static}{SEPARATOR}{user_dynamic}"
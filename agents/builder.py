@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import shutil
@@ -8,20 +9,23 @@ from rich.panel import Panel
 from rich.progress import Progress, TaskID
 
 from utils.ollama_client import OllamaClient
+from agents._prompt import load_prompt_file
 
 console = Console()
 
 class BuilderAgent:
     def __init__(self, ollama_client: OllamaClient):
         self.ollama_client = ollama_client
-        self.model = "deepseek-coder:33b"
+        # Q4_K_M quantization: ~19GB vs ~66GB fp16 and roughly double the
+        # decode throughput on memory-bandwidth-bound hardware, for a slight
+        # quality trade-off acceptable for code generation
+        self.model = "deepseek-coder:33b-instruct-q4_K_M"
         self.agent_name = "Builder (Full-Stack Developer)"
         
     def load_prompt(self) -> str:
         """Load the builder prompt from file."""
         try:
-            with open("prompts/builder_prompt.txt", "r") as f:
-                return f.read()
+            return load_prompt_file("prompts/builder_prompt.txt")
         except FileNotFoundError:
             console.print("[red]Error: builder_prompt.txt not found[/red]")
             return ""
@@ -87,7 +91,22 @@ Generate a production-ready codebase that can be deployed immediately. Do not sk
         
         console.print("[yellow]Generating complete application codebase...[/yellow]")
         console.print("[dim]This may take several minutes for complex applications...[/dim]")
-        
+
+        # First try streaming generation: completed FILE blocks are flushed to
+        # disk while the model is still decoding the rest of the response,
+        # overlapping generation latency with file I/O
+        try:
+            files_created = asyncio.run(
+                self._stream_and_create_files(user_prompt, system_prompt, project_path)
+            )
+        except Exception as e:
+            console.print(f"[yellow]Streaming generation unavailable ({e}), using buffered generation[/yellow]")
+            files_created = 0
+
+        if files_created > 5:
+            console.print(f"[green]✅ Streamed {files_created} files to disk[/green]")
+            return True
+
         # Try multiple generation attempts with different settings
         for attempt in range(3):
             if attempt > 0:
@@ -133,6 +152,72 @@ Generate a production-ready codebase that can be deployed immediately. Do not sk
         console.print("[red]All generation attempts failed. Creating enhanced basic structure...[/red]")
         return self.create_enhanced_basic_structure(project_path, technical_spec)
     
+    async def _stream_and_create_files(self, user_prompt: str, system_prompt: str,
+                                       project_path: str) -> int:
+        """Stream the model response and flush each completed FILE block to disk.
+
+        Runs the same line-oriented state machine as _parse_file_markers, but
+        over the live token stream — a file is written the moment the next
+        FILE: marker (or the end of the stream) closes its block, instead of
+        waiting for the full multi-minute response to buffer.
+        """
+        files_created = 0
+        current_file = None
+        current_content = []
+        in_file_content = False
+        pending = ""
+
+        def handle_line(line: str):
+            nonlocal files_created, current_file, current_content, in_file_content
+            if line.startswith('FILE: '):
+                # Save previous file if exists
+                if current_file and current_content:
+                    self.create_file(project_path, current_file, '\n'.join(current_content))
+                    files_created += 1
+
+                # Start new file
+                current_file = line.replace('FILE: ', '').strip()
+                current_content = []
+                in_file_content = False
+
+            elif line.startswith('PURPOSE: '):
+                pass
+
+            elif line.strip() == '---':
+                in_file_content = not in_file_content
+
+            elif in_file_content and current_file:
+                current_content.append(line)
+
+            elif current_file and not in_file_content and line.strip():
+                current_content.append(line)
+
+        try:
+            async for chunk in self.ollama_client.generate_stream(
+                model=self.model,
+                prompt=user_prompt,
+                system=system_prompt,
+                temperature=0.1,
+                max_tokens=8000
+            ):
+                pending += chunk
+                while '\n' in pending:
+                    line, pending = pending.split('\n', 1)
+                    handle_line(line)
+        finally:
+            # asyncio.run gives this coroutine its own event loop, so the
+            # lazily created session must be closed before the loop ends
+            await self.ollama_client.aclose()
+
+        # Flush the trailing line and the last open file
+        if pending:
+            handle_line(pending)
+        if current_file and current_content:
+            self.create_file(project_path, current_file, '\n'.join(current_content))
+            files_created += 1
+
+        return files_created
+
     def parse_and_create_files(self, response: str, project_path: str) -> bool:
         """Parse the AI response and create the actual files with improved parsing."""
         try:
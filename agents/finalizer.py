@@ -4,7 +4,9 @@ from typing import Dict, Any, Optional, List
 from rich.console import Console
 from rich.panel import Panel
 
+from utils.fsutil import iter_entries
 from utils.ollama_client import OllamaClient
+from agents._prompt import load_prompt_file
 
 console = Console()
 
@@ -17,8 +19,7 @@ class FinalizerAgent:
     def load_prompt(self) -> str:
         """Load the finalizer prompt from file."""
         try:
-            with open("prompts/finalizer_prompt.txt", "r") as f:
-                return f.read()
+            return load_prompt_file("prompts/finalizer_prompt.txt")
         except FileNotFoundError:
             console.print("[red]Error: finalizer_prompt.txt not found[/red]")
             return ""
@@ -108,41 +109,38 @@ Provide a complete assessment and all necessary documentation following the form
         }
         
         try:
-            for root, dirs, files in os.walk(project_path):
-                # Skip node_modules and .next directories
-                dirs[:] = [d for d in dirs if d not in ['node_modules', '.next', '.git', 'dist', 'build']]
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, project_path)
-                    structure["files"].append(relative_path)
-                    
-                    # Check for specific files
-                    if file == "package.json":
-                        structure["has_package_json"] = True
-                    elif file == "next.config.js":
-                        structure["has_next_config"] = True
-                    elif file == "tailwind.config.js":
-                        structure["has_tailwind"] = True
-                    elif file.endswith(('.ts', '.tsx')):
-                        structure["has_typescript"] = True
-                    elif 'prisma' in relative_path.lower():
-                        structure["has_prisma"] = True
-                    elif 'test' in file.lower() or 'spec' in file.lower():
-                        structure["has_tests"] = True
-                    
-                    # Count components and pages
-                    if 'component' in relative_path.lower() and file.endswith(('.tsx', '.jsx')):
-                        structure["component_count"] += 1
-                    elif 'page' in relative_path.lower() or 'app/' in relative_path:
-                        if file.endswith(('.tsx', '.jsx')):
-                            structure["page_count"] += 1
-                    elif 'api/' in relative_path and file.endswith(('.ts', '.js')):
-                        structure["api_route_count"] += 1
-                
-                for dir_name in dirs:
-                    relative_dir = os.path.relpath(os.path.join(root, dir_name), project_path)
-                    structure["directories"].append(relative_dir)
+            for entry_path, is_dir in iter_entries(project_path):
+                relative_path = os.path.relpath(entry_path, project_path)
+
+                if is_dir:
+                    structure["directories"].append(relative_path)
+                    continue
+
+                file = os.path.basename(entry_path)
+                structure["files"].append(relative_path)
+
+                # Check for specific files
+                if file == "package.json":
+                    structure["has_package_json"] = True
+                elif file == "next.config.js":
+                    structure["has_next_config"] = True
+                elif file == "tailwind.config.js":
+                    structure["has_tailwind"] = True
+                elif file.endswith(('.ts', '.tsx')):
+                    structure["has_typescript"] = True
+                elif 'prisma' in relative_path.lower():
+                    structure["has_prisma"] = True
+                elif 'test' in file.lower() or 'spec' in file.lower():
+                    structure["has_tests"] = True
+
+                # Count components and pages
+                if 'component' in relative_path.lower() and file.endswith(('.tsx', '.jsx')):
+                    structure["component_count"] += 1
+                elif 'page' in relative_path.lower() or 'app/' in relative_path:
+                    if file.endswith(('.tsx', '.jsx')):
+                        structure["page_count"] += 1
+                elif 'api/' in relative_path and file.endswith(('.ts', '.js')):
+                    structure["api_route_count"] += 1
         
         except Exception as e:
             console.print(f"[red]Error scanning project structure: {e}[/red]")
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 import re
@@ -6,16 +7,41 @@ from typing import Dict, Any, Optional
 from rich.console import Console
 from rich.panel import Panel
 
+from utils import jsonutil
 from utils.ollama_client import OllamaClient
+from utils.semantic_cache import SemanticCache, EMBEDDING_MODEL
 from model_orchestrator import get_orchestrator, TaskType
+from agents._prompt import build_prompt, load_prompt_file
 
 console = Console()
 
+# Static task instructions, kept identical across calls (and ahead of the
+# per-project data) so the inference engine's prefix cache can skip their
+# prefill on every run after the first
+PLANNER_TASK_PROMPT = """Please analyze the project specification below and create a comprehensive technical specification.
+
+Based on the specification, provide a detailed technical analysis that will guide the development team in building a production-ready web application. Focus on creating actionable specifications that can be directly implemented.
+
+Remember to:
+1. Extract detailed business requirements and technical needs
+2. Design a scalable and maintainable architecture
+3. Specify all necessary components, APIs, and data models
+4. Create a realistic development roadmap
+5. Consider security, performance, and user experience
+6. Provide enterprise-level specifications
+
+Respond with a comprehensive JSON specification following the format specified in the system prompt."""
+
 class PlannerAgent:
-    def __init__(self, ollama_client: OllamaClient):
+    def __init__(self, ollama_client: OllamaClient, semantic_cache: SemanticCache = None):
         self.ollama_client = ollama_client
         self.orchestrator = get_orchestrator()
         self.agent_name = "Planner (Product Manager)"
+        # Reuses prior technical specs for paraphrased project specs; degrades
+        # to a no-op when the embedding model is unavailable
+        self.semantic_cache = semantic_cache or SemanticCache(
+            lambda text: ollama_client.embed(EMBEDDING_MODEL, text)
+        )
     
     def _clean_json_string(self, json_str: str) -> str:
         """Clean control characters and fix common JSON issues."""
@@ -39,8 +65,7 @@ class PlannerAgent:
     def load_prompt(self) -> str:
         """Load the planner prompt from file."""
         try:
-            with open("prompts/planner_prompt.txt", "r") as f:
-                return f.read()
+            return load_prompt_file("prompts/planner_prompt.txt")
         except FileNotFoundError:
             console.print("[red]Error: planner_prompt.txt not found[/red]")
             return ""
@@ -69,25 +94,9 @@ class PlannerAgent:
         if not system_prompt:
             return None
         
-        # Create user prompt with project specification
-        user_prompt = f"""
-Please analyze the following project specification and create a comprehensive technical specification:
-
-PROJECT SPECIFICATION:
-{json.dumps(project_spec, indent=2)}
-
-Based on this specification, provide a detailed technical analysis that will guide the development team in building a production-ready web application. Focus on creating actionable specifications that can be directly implemented.
-
-Remember to:
-1. Extract detailed business requirements and technical needs
-2. Design a scalable and maintainable architecture
-3. Specify all necessary components, APIs, and data models
-4. Create a realistic development roadmap
-5. Consider security, performance, and user experience
-6. Provide enterprise-level specifications
-
-Respond with a comprehensive JSON specification following the format specified in the system prompt.
-        """
+        # Static instructions first, per-project data last (prefix-cache friendly)
+        user_prompt = build_prompt(PLANNER_TASK_PROMPT, f"""PROJECT SPECIFICATION:
+{jsonutil.dumps(project_spec, indent=True)}""")
         
         console.print("[yellow]Generating technical specifications...[/yellow]")
         
@@ -276,7 +285,7 @@ Respond with a comprehensive JSON specification following the format specified i
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
             with open(output_path, "w") as f:
-                json.dump(technical_spec, f, indent=2)
+                f.write(jsonutil.dumps(technical_spec, indent=True))
             
             console.print(f"[green]✅ Technical specification saved to {output_path}[/green]")
             return True
@@ -285,6 +294,26 @@ Respond with a comprehensive JSON specification following the format specified i
             console.print(f"[red]Error saving technical specification: {e}[/red]")
             return False
     
+    def _snapshot_spec(self, technical_spec: Dict[str, Any]) -> Optional[str]:
+        """Write the spec to a content-addressed path and return that path.
+
+        data/technical_spec.json is overwritten by every run, so caching it
+        would let a later lookup serve a different project's spec. The
+        snapshot under data/specs/ is keyed by the spec's own content and
+        never rewritten, so the cached path stays valid forever.
+        """
+        try:
+            spec_json = jsonutil.dumps(technical_spec, indent=True)
+            digest = hashlib.blake2b(spec_json.encode(), digest_size=16).hexdigest()
+            snapshot_path = os.path.join("data", "specs", f"{digest}.json")
+            if not os.path.exists(snapshot_path):
+                os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+                with open(snapshot_path, "w") as f:
+                    f.write(spec_json)
+            return snapshot_path
+        except OSError:
+            return None
+
     def display_summary(self, technical_spec: Dict[str, Any]):
         """Display a summary of the technical specifications."""
         console.print("\n[bold green]📋 Technical Specification Summary[/bold green]")
@@ -327,7 +356,22 @@ Respond with a comprehensive JSON specification following the format specified i
     async def run(self, project_spec_path: str) -> Optional[str]:
         """Run the planner agent and return the path to the technical specification."""
         console.print(f"\n[bold blue]🔄 Starting {self.agent_name}[/bold blue]")
-        
+
+        # Reuse a prior technical spec if this project spec is a near-duplicate
+        # of one we already planned — paraphrased specs produce the same plan
+        spec_text = None
+        try:
+            with open(project_spec_path, "r") as f:
+                spec_text = f.read()
+        except OSError:
+            pass
+
+        if spec_text:
+            cached_path = self.semantic_cache.lookup(spec_text)
+            if cached_path and os.path.exists(cached_path):
+                console.print(f"[green]✅ Reusing technical specification from similar project: {cached_path}[/green]")
+                return cached_path
+
         # Analyze requirements and generate technical specifications
         technical_spec = await self.analyze_requirements(project_spec_path)
         
@@ -341,6 +385,11 @@ Respond with a comprehensive JSON specification following the format specified i
         # Save technical specification
         output_path = "data/technical_spec.json"
         if self.save_technical_spec(technical_spec, output_path):
+            if spec_text:
+                # Cache an immutable snapshot, never the shared output path
+                snapshot_path = self._snapshot_spec(technical_spec)
+                if snapshot_path:
+                    self.semantic_cache.store(spec_text, snapshot_path)
             console.print(f"\n[green]✅ {self.agent_name} completed successfully[/green]")
             return output_path
         else:
@@ -17,7 +17,7 @@ import anthropic
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, TaskID
-from .openrouter_client import OpenRouterClient
+from .openrouter_client import get_openrouter_client
 
 console = Console()
 
@@ -39,7 +39,9 @@ class BaseAgent:
     def __init__(self, name: str, model: str = "gpt-4o"):
         self.name = name
         self.model = model
-        self.openrouter_client = OpenRouterClient()
+        # All agents share one client so connection pools stay warm and
+        # cost tracking covers the whole run
+        self.openrouter_client = get_openrouter_client()
         self.console = console
     
     async def execute(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -394,7 +396,47 @@ class MultiAgentOrchestrator:
             "quality": QualityAgent()
         }
         self.console = console
-    
+        # Bounds concurrent LLM calls across a wavefront so widening the
+        # fan-out never floods the provider with unbounded requests
+        self.max_concurrency = 10
+
+    async def _run_agents_concurrently(self, progress: Progress, agent_tasks: List[tuple],
+                                       project_description: str, context: Dict[str, Any],
+                                       results: Dict[str, Any]):
+        """Run a wavefront of agents and tick progress as each one finishes.
+
+        agent_tasks is a list of (agent_name, description) pairs. Each agent
+        gets its own progress row that completes the moment that agent's
+        task does, instead of all rows filling at once after the slowest
+        agent returns.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_agent(agent_name):
+            async with semaphore:
+                return await self.agents[agent_name].execute(project_description, context)
+
+        task_map = {}
+        for agent_name, description in agent_tasks:
+            task_id = progress.add_task(description, total=1)
+            task = asyncio.create_task(run_agent(agent_name))
+            task_map[task] = (agent_name, task_id)
+
+        pending = set(task_map)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                agent_name, task_id = task_map[task]
+                try:
+                    result = task.result()
+                except Exception as e:
+                    self.console.print(f"❌ {agent_name} failed: {e}", style="red")
+                    results[agent_name] = {"error": str(e), "status": "failed"}
+                else:
+                    results[agent_name] = result
+                    context.update(result)
+                progress.update(task_id, completed=1)
+
     async def build_project(self, project_description: str) -> Dict[str, Any]:
         """Orchestrate all agents to build a complete project"""
         
@@ -406,7 +448,9 @@ class MultiAgentOrchestrator:
         results = {}
         context = {"requirements": project_description}
         
-        with Progress() as progress:
+        # 4 redraws/s is plenty for coarse per-agent ticks and keeps Rich's
+        # ANSI rewrites out of the way of the actual work
+        with Progress(refresh_per_second=4) as progress:
             # Phase 1: Architecture
             arch_task = progress.add_task("🏗️  Architecture Design", total=1)
             arch_result = await self.agents["architect"].execute(project_description, context)
@@ -414,56 +458,26 @@ class MultiAgentOrchestrator:
             context.update(arch_result)
             progress.update(arch_task, completed=1)
             
-            # Phase 2: Parallel Development
+            # Phase 2: Parallel Development — deployment only depends on the
+            # architecture from phase 1, so it rides this wavefront too
             dev_tasks = [
                 ("database", "💾 Database Design"),
-                ("backend", "⚙️  Backend Development"), 
-                ("frontend", "🎨 Frontend Development")
+                ("backend", "⚙️  Backend Development"),
+                ("frontend", "🎨 Frontend Development"),
+                ("deployment", "🚀 Deployment Setup")
             ]
-            
-            task_ids = []
-            for agent_name, description in dev_tasks:
-                task_id = progress.add_task(description, total=1)
-                task_ids.append((agent_name, task_id))
-            
-            # Execute development phases in parallel
-            dev_results = await asyncio.gather(*[
-                self.agents[agent_name].execute(project_description, context)
-                for agent_name, _ in dev_tasks
-            ], return_exceptions=True)
-            
-            for (agent_name, task_id), result in zip(task_ids, dev_results):
-                if isinstance(result, Exception):
-                    self.console.print(f"❌ {agent_name} failed: {result}", style="red")
-                    results[agent_name] = {"error": str(result), "status": "failed"}
-                else:
-                    results[agent_name] = result
-                    context.update(result)
-                progress.update(task_id, completed=1)
-            
-            # Phase 3: Deployment & Quality
+            await self._run_agents_concurrently(
+                progress, dev_tasks, project_description, context, results
+            )
+
+            # Phase 3: Quality Assurance reviews the full build context, so
+            # it runs after everything else has landed
             final_tasks = [
-                ("deployment", "🚀 Deployment Setup"),
                 ("quality", "🧪 Quality Assurance")
             ]
-            
-            final_task_ids = []
-            for agent_name, description in final_tasks:
-                task_id = progress.add_task(description, total=1)
-                final_task_ids.append((agent_name, task_id))
-            
-            final_results = await asyncio.gather(*[
-                self.agents[agent_name].execute(project_description, context)
-                for agent_name, _ in final_tasks
-            ], return_exceptions=True)
-            
-            for (agent_name, task_id), result in zip(final_task_ids, final_results):
-                if isinstance(result, Exception):
-                    self.console.print(f"❌ {agent_name} failed: {result}", style="red")
-                    results[agent_name] = {"error": str(result), "status": "failed"}
-                else:
-                    results[agent_name] = result
-                progress.update(task_id, completed=1)
+            await self._run_agents_concurrently(
+                progress, final_tasks, project_description, context, results
+            )
         
         self.console.print(Panel.fit(
             "✅ Project build completed successfully!",
@@ -10,6 +10,8 @@ OpenRouter Client for +++A Project Builder 2030
 import os
 import json
 import asyncio
+import hashlib
+from functools import cache
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import openai
@@ -97,7 +99,40 @@ class OpenRouterClient:
         
         self.request_history = []
         self.total_cost = 0.0
-    
+
+        # Content-addressed response cache — repeat builds of the same
+        # prompts (boilerplate scaffolds, templates) skip the network call
+        # and cost nothing
+        self.cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "orchestra", "llm")
+
+    @staticmethod
+    def _cache_key(model: str, prompt: str, max_tokens: int, temperature: float) -> str:
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        return hashlib.blake2b(
+            json.dumps(payload, sort_keys=True).encode(), digest_size=16
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "r") as f:
+                return json.load(f)["response"]
+        except (OSError, json.JSONDecodeError, KeyError):
+            return None
+
+    def _cache_set(self, key: str, response: str):
+        # Best effort: an unwritable cache dir never fails the request
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "w") as f:
+                json.dump({"response": response}, f)
+        except OSError:
+            pass
+
     def get_optimal_model(self, task_type: str, complexity: str = "medium") -> str:
         """Select the best model for a given task and complexity"""
         
@@ -125,17 +160,37 @@ class OpenRouterClient:
         selected_model = self.get_optimal_model(task_type, complexity)
         models_to_try = [selected_model] + [m for m in self.fallback_models if m != selected_model]
         
+        max_tokens = int(os.getenv("MAX_TOKENS_PER_REQUEST", "4000"))
+
         for attempt, model in enumerate(models_to_try[:max_retries]):
             try:
+                # Serve identical requests from the disk cache before any
+                # network work; the key includes the model so a fallback
+                # model never reuses another model's answer
+                cache_key = self._cache_key(model, prompt, max_tokens, 0.7)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    console.print(f"💾 Cache hit for {self.models[model].name} — $0.0000", style="green")
+                    self.request_history.append({
+                        "model": model,
+                        "task_type": task_type,
+                        "tokens_used": 0,
+                        "cost": 0.0,
+                        "response_time": 0.0,
+                        "success": True,
+                        "cached": True
+                    })
+                    return cached, model, 0.0
+
                 console.print(f"🤖 Using model: {self.models[model].name} (Attempt {attempt + 1})", style="blue")
-                
+
                 start_time = time.time()
-                
+
                 response = await asyncio.to_thread(
                     self.client.chat.completions.create,
                     model=model,
                     messages=[{"role": "user", "content": prompt}],
-                    max_tokens=int(os.getenv("MAX_TOKENS_PER_REQUEST", "4000")),
+                    max_tokens=max_tokens,
                     temperature=0.7
                 )
                 
@@ -163,7 +218,8 @@ class OpenRouterClient:
                 })
                 
                 console.print(f"✅ Success! Cost: ${cost:.4f}, Tokens: {tokens_used}, Time: {response_time:.2f}s", style="green")
-                
+
+                self._cache_set(cache_key, content)
                 return content, model, cost
                 
             except Exception as e:
@@ -185,6 +241,54 @@ class OpenRouterClient:
         
         raise Exception("Unexpected error in fallback system")
     
+    async def generate_stream(self, prompt: str, task_type: str = "general",
+                              complexity: str = "medium"):
+        """Yield response text chunks as the model produces them.
+
+        Callers can start acting on early output (writing completed file
+        blocks to disk, updating displays) while the rest of the response is
+        still generating — time to first output drops from full-completion
+        latency to first-token latency. The sync OpenAI SDK stream runs in a
+        worker thread and feeds an asyncio queue, so the event loop stays
+        free while tokens arrive.
+        """
+        model = self.get_optimal_model(task_type, complexity)
+        console.print(f"🤖 Streaming from model: {self.models[model].name}", style="blue")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        end_of_stream = object()
+
+        def produce():
+            try:
+                stream = self.client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=int(os.getenv("MAX_TOKENS_PER_REQUEST", "4000")),
+                    temperature=0.7,
+                    stream=True
+                )
+                for event in stream:
+                    delta = event.choices[0].delta.content if event.choices else None
+                    if delta:
+                        loop.call_soon_threadsafe(queue.put_nowait, delta)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, end_of_stream)
+
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is end_of_stream:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            await producer
+
     def get_cost_summary(self) -> Dict[str, Any]:
         """Get detailed cost and usage summary"""
         total_requests = len(self.request_history)
@@ -229,9 +333,22 @@ class OpenRouterClient:
             border_style="blue"
         ))
 
+@cache
+def get_openrouter_client() -> OpenRouterClient:
+    """Return the process-wide shared OpenRouter client.
+
+    Every agent constructing its own client meant one OpenAI SDK instance
+    (and connection pool) per agent, and cost tracking fragmented across
+    them. Sharing a single instance keeps connections warm across calls
+    and makes request_history/total_cost reflect the whole run. A missing
+    API key still raises on every call since exceptions aren't cached.
+    """
+    return OpenRouterClient()
+
+
 # Convenience function for easy usage
 async def generate_ai_response(prompt: str, task_type: str = "general", complexity: str = "medium") -> str:
     """Simple function to generate AI response using OpenRouter"""
-    client = OpenRouterClient()
+    client = get_openrouter_client()
     response, model, cost = await client.generate_with_fallback(prompt, task_type, complexity)
-    return response 
\ No newline at end of file
+    return response
\ No newline at end of file
@@ -8,19 +8,29 @@ Tech Stack Upgrader for +++A Project Builder 2030
 """
 
 import os
+import copy
 import json
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from enum import Enum
+import sys
+from functools import lru_cache
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-console = Console()
+# rich is only needed for the display paths; importing it lazily keeps
+# programmatic use (get_recommended_stack, generate_package_json) fast.
+_console = None
 
-class TechCategory(Enum):
-    """Categories of technologies"""
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+class TechCategory:
+    """Categories of technologies (plain string constants; cheaper than Enum lookups)"""
     FRONTEND = "frontend"
     BACKEND = "backend"
     DATABASE = "database"
@@ -30,369 +40,334 @@ class TechCategory(Enum):
     MONITORING = "monitoring"
     SECURITY = "security"
 
-@dataclass
+def _t(*items: str) -> Tuple[str, ...]:
+    """Intern and freeze a group of short descriptive strings so equal
+    tuples across stacks share storage."""
+    return tuple(sys.intern(s) for s in items)
+
+# frozen but not slotted: dataclass slots=True needs Python 3.10 and
+# setup.py supports 3.9
+@dataclass(frozen=True)
 class TechStack:
     """Modern technology stack configuration"""
     name: str
-    category: TechCategory
+    category: str  # One of the TechCategory constants
     version: str
     description: str
-    benefits: List[str]
+    benefits: Tuple[str, ...]
     complexity: str  # 'beginner', 'intermediate', 'advanced'
     adoption_rate: str  # 'stable', 'growing', 'cutting_edge'
     learning_curve: str  # 'easy', 'medium', 'steep'
-    ecosystem: List[str]  # Related technologies
+    ecosystem: Tuple[str, ...]  # Related technologies
+    short_benefits: str = field(init=False)  # Precomputed summary for table rendering
+
+    def __post_init__(self):
+        object.__setattr__(self, "short_benefits",
+                           ", ".join(self.benefits[:2]) + ("..." if len(self.benefits) > 2 else ""))
+
+# The catalogue never changes at runtime; build it once at import.
+_TECH_STACKS: Dict[str, TechStack] = {
+    # Frontend Technologies
+    "react_18": TechStack(
+        name="React 18",
+        category=TechCategory.FRONTEND,
+        version="18.x",
+        description="Modern React with Concurrent Features, Suspense, and Server Components",
+        benefits=_t(
+            "Concurrent rendering for better UX",
+            "Automatic batching for performance",
+            "Suspense for data fetching",
+            "Server Components for reduced bundle size",
+            "Improved hydration"
+        ),
+        complexity="intermediate",
+        adoption_rate="stable",
+        learning_curve="medium",
+        ecosystem=_t("Next.js", "Vite", "TypeScript", "React Query")
+    ),
+    
+    "nextjs_14": TechStack(
+        name="Next.js 14",
+        category=TechCategory.FRONTEND,
+        version="14.x",
+        description="Full-stack React framework with App Router, Server Actions, and Edge Runtime",
+        benefits=_t(
+            "App Router for better file-based routing",
+            "Server Actions for form handling",
+            "Built-in TypeScript support",
+            "Image and font optimization",
+            "Edge Runtime support",
+            "Incremental Static Regeneration"
+        ),
+        complexity="intermediate",
+        adoption_rate="growing",
+        learning_curve="medium",
+        ecosystem=_t("React", "TypeScript", "Tailwind", "Vercel")
+    ),
+    
+    "typescript_5": TechStack(
+        name="TypeScript 5",
+        category=TechCategory.FRONTEND,
+        version="5.x",
+        description="Strongly typed JavaScript with advanced type system and decorators",
+        benefits=_t(
+            "Static type checking",
+            "Better IDE support",
+            "Decorators support",
+            "Template literal types",
+            "Conditional types",
+            "Better error messages"
+        ),
+        complexity="intermediate",
+        adoption_rate="stable",
+        learning_curve="medium",
+        ecosystem=_t("React", "Node.js", "Vue", "Angular")
+    ),
+    
+    "vite_5": TechStack(
+        name="Vite 5",
+        category=TechCategory.FRONTEND,
+        version="5.x",
+        description="Lightning-fast build tool with HMR and optimized bundling",
+        benefits=_t(
+            "Instant server start",
+            "Lightning fast HMR",
+            "Rich feature set",
+            "Optimized build",
+            "Framework agnostic",
+            "Plugin ecosystem"
+        ),
+        complexity="beginner",
+        adoption_rate="growing",
+        learning_curve="easy",
+        ecosystem=_t("React", "Vue", "Svelte", "Solid")
+    ),
+    
+    "framer_motion": TechStack(
+        name="Framer Motion 11",
+        category=TechCategory.FRONTEND,
+        version="11.x",
+        description="Production-ready motion library for React to create realistic animations",
+        benefits=_t(
+            "Declarative animations",
+            "Gesture support",
+            "Layout and shared layout transitions",
+            "Scroll-triggered animations",
+            "TypeScript support",
+            "Performance optimizations"
+        ),
+        complexity="beginner",
+        adoption_rate="growing",
+        learning_curve="easy",
+        ecosystem=_t("React", "Next.js", "TypeScript")
+    ),
+    
+    # Styling Technologies
+    "tailwindcss_3": TechStack(
+        name="Tailwind CSS 3",
+        category=TechCategory.STYLING,
+        version="3.x",
+        description="Utility-first CSS framework with JIT compiler and component variants",
+        benefits=_t(
+            "Utility-first approach",
+            "JIT compiler for smaller builds",
+            "Component variants",
+            "Dark mode support",
+            "Responsive design utilities",
+            "Customizable design system"
+        ),
+        complexity="beginner",
+        adoption_rate="stable",
+        learning_curve="easy",
+        ecosystem=_t("Next.js", "React", "Vue", "Headless UI")
+    ),
+    
+    "shadcn_ui": TechStack(
+        name="shadcn/ui",
+        category=TechCategory.STYLING,
+        version="latest",
+        description="Beautifully designed components built with Radix UI and Tailwind CSS",
+        benefits=_t(
+            "Copy-paste components",
+            "Fully customizable",
+            "Accessible by default",
+            "TypeScript support",
+            "Themeable",
+            "No package dependency"
+        ),
+        complexity="beginner",
+        adoption_rate="growing",
+        learning_curve="easy",
+        ecosystem=_t("React", "Tailwind", "Radix UI", "TypeScript")
+    ),
+    
+    # Testing Technologies
+    "vitest": TechStack(
+        name="Vitest",
+        category=TechCategory.TESTING,
+        version="1.x",
+        description="Blazing fast unit test framework powered by Vite with Jest compatibility",
+        benefits=_t(
+            "Blazing fast execution",
+            "Jest compatibility",
+            "TypeScript support",
+            "ESM first",
+            "Watch mode",
+            "Coverage reports"
+        ),
+        complexity="beginner",
+        adoption_rate="growing",
+        learning_curve="easy",
+        ecosystem=_t("Vite", "Jest", "Testing Library", "TypeScript")
+    ),
+    
+    "playwright": TechStack(
+        name="Playwright",
+        category=TechCategory.TESTING,
+        version="1.x",
+        description="Cross-browser end-to-end testing with auto-wait and parallel execution",
+        benefits=_t(
+            "Cross-browser testing",
+            "Auto-wait for elements",
+            "Parallel execution",
+            "Screenshots/videos",
+            "Network interception",
+            "Mobile testing"
+        ),
+        complexity="intermediate",
+        adoption_rate="growing",
+        learning_curve="medium",
+        ecosystem=_t("TypeScript", "CI/CD", "Docker", "GitHub Actions")
+    ),
+}
+
+# Table rows are pure functions of the catalogue; format them once at import
+# so display_stack_comparison never titles/replaces strings per render.
+_ROW_CACHE: Dict[str, Tuple[str, ...]] = {
+    key: (
+        stack.name,
+        stack.category.title(),
+        stack.complexity.title(),
+        stack.adoption_rate.replace("_", " ").title(),
+        stack.learning_curve.title(),
+        stack.short_benefits,
+    )
+    for key, stack in _TECH_STACKS.items()
+}
+
+# The generated layout is identical for every stack; expose one read-only
+# mapping instead of rebuilding the dict per call.
+_PROJECT_STRUCTURE: Mapping[str, str] = MappingProxyType({
+        # Configuration files
+        "package.json": "Generated package.json with modern dependencies",
+        "tsconfig.json": "TypeScript configuration with strict settings",
+        "tailwind.config.js": "Tailwind CSS configuration",
+        "next.config.js": "Next.js configuration with optimizations",
+        ".gitignore": "Git ignore file for Node.js and Next.js",
+        ".env.example": "Environment variables template",
+        "README.md": "Project documentation and setup guide",
+        
+        # Source code structure
+        "src/app/": "Next.js App Router pages and layouts",
+        "src/components/": "React components",
+        "src/components/ui/": "shadcn/ui components",
+        "src/lib/": "Utility functions and configurations",
+        "src/hooks/": "Custom React hooks",
+        "src/types/": "TypeScript type definitions",
+        "src/styles/": "Global styles and CSS",
+        
+        # API routes (for frontend-only projects)
+        "src/app/api/": "Next.js API routes for frontend functionality",
+        
+        # Testing
+        "tests/": "Test files and utilities",
+        "tests/unit/": "Unit tests",
+        "tests/e2e/": "End-to-end tests",
+        "vitest.config.ts": "Vitest configuration",
+        "playwright.config.ts": "Playwright configuration",
+})
+
+# Recommended stack presets per project type; filtered variants are memoized
+# below so repeat recommendations are a hashed lookup.
+_STACK_PRESETS = MappingProxyType({
+    "saas_platform": (
+        ("frontend", _t("nextjs_14", "react_18", "typescript_5", "framer_motion")),
+        ("styling", _t("tailwindcss_3", "shadcn_ui")),
+        ("testing", _t("vitest", "playwright")),
+    ),
+    "ecommerce": (
+        ("frontend", _t("nextjs_14", "react_18", "typescript_5", "framer_motion")),
+        ("styling", _t("tailwindcss_3",)),
+        ("testing", _t("vitest",)),
+    ),
+    "portfolio": (
+        ("frontend", _t("nextjs_14", "react_18", "typescript_5", "framer_motion")),
+        ("styling", _t("tailwindcss_3",)),
+        ("testing", _t("vitest",)),
+    ),
+    "marketplace": (
+        ("frontend", _t("nextjs_14", "react_18", "typescript_5", "framer_motion")),
+        ("styling", _t("tailwindcss_3", "shadcn_ui")),
+        ("testing", _t("vitest", "playwright")),
+    ),
+})
+
+
+@lru_cache(maxsize=32)
+def _recommended_stack(project_type: str, complexity_level: str) -> tuple:
+    """Resolve (project_type, complexity_level) to a tuple of (category, techs).
+
+    Pure function of its arguments over the module-level catalogue, so the
+    lru_cache makes repeat recommendations (the common case in batch runs)
+    a single hashed lookup.
+    """
+    preset = _STACK_PRESETS.get(project_type, ())
+    if complexity_level != "beginner":
+        return preset
+    # Beginner projects drop advanced technologies
+    return tuple(
+        (category, tuple(
+            tech for tech in techs
+            if getattr(_TECH_STACKS.get(tech), "complexity", "advanced") != "advanced"
+        ))
+        for category, techs in preset
+    )
+
 
 class ModernTechStackManager:
     """Manages modern technology stacks for 2030"""
     
     def __init__(self):
         self.tech_stacks = self._initialize_tech_stacks()
-        self.console = console
     
     def _initialize_tech_stacks(self) -> Dict[str, TechStack]:
         """Initialize modern technology stacks"""
-        return {
-            # Frontend Technologies
-            "react_18": TechStack(
-                name="React 18",
-                category=TechCategory.FRONTEND,
-                version="18.x",
-                description="Modern React with Concurrent Features, Suspense, and Server Components",
-                benefits=[
-                    "Concurrent rendering for better UX",
-                    "Automatic batching for performance",
-                    "Suspense for data fetching",
-                    "Server Components for reduced bundle size",
-                    "Improved hydration"
-                ],
-                complexity="intermediate",
-                adoption_rate="stable",
-                learning_curve="medium",
-                ecosystem=["Next.js", "Vite", "TypeScript", "React Query"]
-            ),
-            
-            "nextjs_14": TechStack(
-                name="Next.js 14",
-                category=TechCategory.FRONTEND,
-                version="14.x",
-                description="Full-stack React framework with App Router, Server Actions, and Edge Runtime",
-                benefits=[
-                    "App Router for better file-based routing",
-                    "Server Actions for form handling",
-                    "Built-in TypeScript support",
-                    "Image and font optimization",
-                    "Edge Runtime support",
-                    "Incremental Static Regeneration"
-                ],
-                complexity="intermediate",
-                adoption_rate="growing",
-                learning_curve="medium",
-                ecosystem=["React", "TypeScript", "Tailwind", "Vercel"]
-            ),
-            
-            "typescript_5": TechStack(
-                name="TypeScript 5",
-                category=TechCategory.FRONTEND,
-                version="5.x",
-                description="Strongly typed JavaScript with advanced type system and decorators",
-                benefits=[
-                    "Static type checking",
-                    "Better IDE support",
-                    "Decorators support",
-                    "Template literal types",
-                    "Conditional types",
-                    "Better error messages"
-                ],
-                complexity="intermediate",
-                adoption_rate="stable",
-                learning_curve="medium",
-                ecosystem=["React", "Node.js", "Vue", "Angular"]
-            ),
-            
-            "vite_5": TechStack(
-                name="Vite 5",
-                category=TechCategory.FRONTEND,
-                version="5.x",
-                description="Lightning-fast build tool with HMR and optimized bundling",
-                benefits=[
-                    "Instant server start",
-                    "Lightning fast HMR",
-                    "Rich feature set",
-                    "Optimized build",
-                    "Framework agnostic",
-                    "Plugin ecosystem"
-                ],
-                complexity="beginner",
-                adoption_rate="growing",
-                learning_curve="easy",
-                ecosystem=["React", "Vue", "Svelte", "Solid"]
-            ),
-            
-            "framer_motion": TechStack(
-                name="Framer Motion 11",
-                category=TechCategory.FRONTEND,
-                version="11.x",
-                description="Production-ready motion library for React to create realistic animations",
-                benefits=[
-                    "Declarative animations",
-                    "Gesture support",
-                    "Layout and shared layout transitions",
-                    "Scroll-triggered animations",
-                    "TypeScript support",
-                    "Performance optimizations"
-                ],
-                complexity="beginner",
-                adoption_rate="growing",
-                learning_curve="easy",
-                ecosystem=["React", "Next.js", "TypeScript"]
-            ),
-            
-            # Styling Technologies
-            "tailwindcss_3": TechStack(
-                name="Tailwind CSS 3",
-                category=TechCategory.STYLING,
-                version="3.x",
-                description="Utility-first CSS framework with JIT compiler and component variants",
-                benefits=[
-                    "Utility-first approach",
-                    "JIT compiler for smaller builds",
-                    "Component variants",
-                    "Dark mode support",
-                    "Responsive design utilities",
-                    "Customizable design system"
-                ],
-                complexity="beginner",
-                adoption_rate="stable",
-                learning_curve="easy",
-                ecosystem=["Next.js", "React", "Vue", "Headless UI"]
-            ),
-            
-            "shadcn_ui": TechStack(
-                name="shadcn/ui",
-                category=TechCategory.STYLING,
-                version="latest",
-                description="Beautifully designed components built with Radix UI and Tailwind CSS",
-                benefits=[
-                    "Copy-paste components",
-                    "Fully customizable",
-                    "Accessible by default",
-                    "TypeScript support",
-                    "Themeable",
-                    "No package dependency"
-                ],
-                complexity="beginner",
-                adoption_rate="growing",
-                learning_curve="easy",
-                ecosystem=["React", "Tailwind", "Radix UI", "TypeScript"]
-            ),
-            
-            # Testing Technologies
-            "vitest": TechStack(
-                name="Vitest",
-                category=TechCategory.TESTING,
-                version="1.x",
-                description="Blazing fast unit test framework powered by Vite with Jest compatibility",
-                benefits=[
-                    "Blazing fast execution",
-                    "Jest compatibility",
-                    "TypeScript support",
-                    "ESM first",
-                    "Watch mode",
-                    "Coverage reports"
-                ],
-                complexity="beginner",
-                adoption_rate="growing",
-                learning_curve="easy",
-                ecosystem=["Vite", "Jest", "Testing Library", "TypeScript"]
-            ),
-            
-            "playwright": TechStack(
-                name="Playwright",
-                category=TechCategory.TESTING,
-                version="1.x",
-                description="Cross-browser end-to-end testing with auto-wait and parallel execution",
-                benefits=[
-                    "Cross-browser testing",
-                    "Auto-wait for elements",
-                    "Parallel execution",
-                    "Screenshots/videos",
-                    "Network interception",
-                    "Mobile testing"
-                ],
-                complexity="intermediate",
-                adoption_rate="growing",
-                learning_curve="medium",
-                ecosystem=["TypeScript", "CI/CD", "Docker", "GitHub Actions"]
-            ),
-        }
+        return _TECH_STACKS
     
     def get_recommended_stack(self, project_type: str, complexity_level: str = "intermediate") -> Dict[str, List[str]]:
         """Get recommended technology stack for a project type"""
-        
-        stacks = {
-            "saas_platform": {
-                "frontend": ["nextjs_14", "react_18", "typescript_5", "framer_motion"],
-                "styling": ["tailwindcss_3", "shadcn_ui"],
-                "testing": ["vitest", "playwright"]
-            },
-            "ecommerce": {
-                "frontend": ["nextjs_14", "react_18", "typescript_5", "framer_motion"],
-                "styling": ["tailwindcss_3"],
-                "testing": ["vitest"]
-            },
-            "portfolio": {
-                "frontend": ["nextjs_14", "react_18", "typescript_5", "framer_motion"],
-                "styling": ["tailwindcss_3"],
-                "testing": ["vitest"]
-            },
-            "marketplace": {
-                "frontend": ["nextjs_14", "react_18", "typescript_5", "framer_motion"],
-                "styling": ["tailwindcss_3", "shadcn_ui"],
-                "testing": ["vitest", "playwright"]
-            }
+        return {
+            category: list(techs)
+            for category, techs in _recommended_stack(project_type, complexity_level)
         }
-        
-        # Filter by complexity level
-        if complexity_level == "beginner":
-            # Remove advanced technologies
-            filtered_stack = {}
-            for category, techs in stacks.get(project_type, {}).items():
-                filtered_stack[category] = [
-                    tech for tech in techs 
-                    if self.tech_stacks.get(tech, TechStack("", TechCategory.FRONTEND, "", "", [], "advanced", "", "", [])).complexity != "advanced"
-                ]
-        else:
-            filtered_stack = stacks.get(project_type, {})
-        
-        return filtered_stack
     
     def generate_package_json(self, recommended_stack: Dict[str, List[str]], project_name: str = "modern-app") -> Dict[str, Any]:
         """Generate modern package.json with recommended technologies"""
-        
-        # Base dependencies
-        dependencies = {
-            "react": "^18.2.0",
-            "react-dom": "^18.2.0",
-            "next": "^14.0.0",
-            "typescript": "^5.0.0"
-        }
-        
-        dev_dependencies = {
-            "@types/node": "^20.0.0",
-            "@types/react": "^18.2.0",
-            "@types/react-dom": "^18.2.0"
-        }
-        
-        # Add dependencies based on stack
-        for category, techs in recommended_stack.items():
-            for tech in techs:
-                if tech == "tailwindcss_3":
-                    dependencies.update({
-                        "tailwindcss": "^3.4.0",
-                        "autoprefixer": "^10.4.0",
-                        "postcss": "^8.4.0",
-                        "tailwindcss-rtl": "^3.3.0"
-                    })
-                elif tech == "shadcn_ui":
-                    dependencies.update({
-                        "@radix-ui/react-dialog": "^1.0.0",
-                        "@radix-ui/react-dropdown-menu": "^2.0.0",
-                        "@radix-ui/react-slot": "^1.0.0",
-                        "class-variance-authority": "^0.7.0",
-                        "clsx": "^2.0.0",
-                        "lucide-react": "^0.300.0",
-                        "tailwind-merge": "^2.0.0"
-                    })
-                elif tech == "framer_motion":
-                    dependencies.update({
-                        "framer-motion": "^11.0.0"
-                    })
-                elif tech == "vitest":
-                    dev_dependencies.update({
-                        "vitest": "^1.0.0",
-                        "@testing-library/react": "^14.1.0",
-                        "@testing-library/jest-dom": "^6.1.0",
-                        "jsdom": "^23.0.0"
-                    })
-                elif tech == "playwright":
-                    dev_dependencies.update({
-                        "@playwright/test": "^1.40.0"
-                    })
-        
-        scripts = {
-            "dev": "next dev",
-            "build": "next build",
-            "start": "next start",
-            "lint": "next lint",
-            "type-check": "tsc --noEmit"
-        }
-        
-        # Add testing scripts if testing frameworks are included
-        if "vitest" in str(recommended_stack):
-            scripts.update({
-                "test": "vitest",
-                "test:ui": "vitest --ui",
-                "test:coverage": "vitest --coverage"
-            })
-        
-        if "playwright" in str(recommended_stack):
-            scripts.update({
-                "test:e2e": "playwright test",
-                "test:e2e:ui": "playwright test --ui"
-            })
-        
-        return {
-            "name": project_name,
-            "version": "0.1.0",
-            "private": True,
-            "scripts": scripts,
-            "dependencies": dependencies,
-            "devDependencies": dev_dependencies,
-            "engines": {
-                "node": ">=20.0.0",
-                "npm": ">=10.0.0"
-            }
-        }
-    
-    def generate_project_structure(self, recommended_stack: Dict[str, List[str]]) -> Dict[str, str]:
+
+        # Canonicalize the stack into a hashable signature so identical
+        # shapes hit the cache; hand callers a private deep copy.
+        stack_sig = tuple(sorted((category, tuple(techs)) for category, techs in recommended_stack.items()))
+        return copy.deepcopy(_build_package_json(stack_sig, project_name))
+
+    def generate_project_structure(self, recommended_stack: Dict[str, List[str]]) -> Mapping[str, str]:
         """Generate modern project structure with recommended technologies"""
-        
-        structure = {
-            # Configuration files
-            "package.json": "Generated package.json with modern dependencies",
-            "tsconfig.json": "TypeScript configuration with strict settings",
-            "tailwind.config.js": "Tailwind CSS configuration",
-            "next.config.js": "Next.js configuration with optimizations",
-            ".gitignore": "Git ignore file for Node.js and Next.js",
-            ".env.example": "Environment variables template",
-            "README.md": "Project documentation and setup guide",
-            
-            # Source code structure
-            "src/app/": "Next.js App Router pages and layouts",
-            "src/components/": "React components",
-            "src/components/ui/": "shadcn/ui components",
-            "src/lib/": "Utility functions and configurations",
-            "src/hooks/": "Custom React hooks",
-            "src/types/": "TypeScript type definitions",
-            "src/styles/": "Global styles and CSS",
-            
-            # API routes (for frontend-only projects)
-            "src/app/api/": "Next.js API routes for frontend functionality",
-            
-            # Testing
-            "tests/": "Test files and utilities",
-            "tests/unit/": "Unit tests",
-            "tests/e2e/": "End-to-end tests",
-            "vitest.config.ts": "Vitest configuration",
-            "playwright.config.ts": "Playwright configuration",
-        }
-        
-        return structure
+        return _PROJECT_STRUCTURE
     
     def display_stack_comparison(self, stacks: List[str]):
         """Display comparison table of technology stacks"""
-        
+
+        from rich.table import Table
+
         table = Table(title="Technology Stack Comparison")
         table.add_column("Technology", style="cyan")
         table.add_column("Category", style="magenta")
@@ -402,34 +377,19 @@ class ModernTechStackManager:
         table.add_column("Key Benefits", style="blue")
         
         for stack_name in stacks:
-            if stack_name in self.tech_stacks:
-                stack = self.tech_stacks[stack_name]
-                benefits = ", ".join(stack.benefits[:2]) + "..." if len(stack.benefits) > 2 else ", ".join(stack.benefits)
-                table.add_row(
-                    stack.name,
-                    stack.category.value.title(),
-                    stack.complexity.title(),
-                    stack.adoption_rate.replace("_", " ").title(),
-                    stack.learning_curve.title(),
-                    benefits
-                )
+            row = _ROW_CACHE.get(stack_name)
+            if row is not None:
+                table.add_row(*row)
         
-        self.console.print(table)
+        _get_console().print(table)
     
     def generate_upgrade_guide(self, current_stack: Dict[str, str], target_stack: Dict[str, List[str]]) -> str:
         """Generate upgrade guide from current to target stack"""
         
-        guide = """
-# Technology Stack Upgrade Guide
-
-## Current vs Target Stack
-
-### Migration Steps
+        parts = [_UPGRADE_GUIDE_HEADER]
 
-"""
-        
         for category, new_techs in target_stack.items():
-            guide += f"""
+            parts.append(f"""
 #### {category.title()} Migration
 
 **Target Technologies**: {', '.join(new_techs)}
@@ -441,9 +401,109 @@ class ModernTechStackManager:
 4. Update tests
 5. Verify functionality
 
+""")
+
+        parts.append(_UPGRADE_GUIDE_FOOTER)
+        return "".join(parts)
+
+@lru_cache(maxsize=64)
+def _build_package_json(stack_sig: Tuple[Tuple[str, Tuple[str, ...]], ...], project_name: str) -> Dict[str, Any]:
+    """Build the package.json dict for a canonicalized stack signature."""
+    # Base dependencies
+    dependencies = {
+        "react": "^18.2.0",
+        "react-dom": "^18.2.0",
+        "next": "^14.0.0",
+        "typescript": "^5.0.0"
+    }
+    
+    dev_dependencies = {
+        "@types/node": "^20.0.0",
+        "@types/react": "^18.2.0",
+        "@types/react-dom": "^18.2.0"
+    }
+    
+    # Add dependencies based on stack (the category key is irrelevant here,
+    # so iterate the flattened tech list directly)
+    for tech in chain.from_iterable(techs for _, techs in stack_sig):
+        if tech == "tailwindcss_3":
+            dependencies.update({
+                "tailwindcss": "^3.4.0",
+                "autoprefixer": "^10.4.0",
+                "postcss": "^8.4.0",
+                "tailwindcss-rtl": "^3.3.0"
+            })
+        elif tech == "shadcn_ui":
+            dependencies.update({
+                "@radix-ui/react-dialog": "^1.0.0",
+                "@radix-ui/react-dropdown-menu": "^2.0.0",
+                "@radix-ui/react-slot": "^1.0.0",
+                "class-variance-authority": "^0.7.0",
+                "clsx": "^2.0.0",
+                "lucide-react": "^0.300.0",
+                "tailwind-merge": "^2.0.0"
+            })
+        elif tech == "framer_motion":
+            dependencies.update({
+                "framer-motion": "^11.0.0"
+            })
+        elif tech == "vitest":
+            dev_dependencies.update({
+                "vitest": "^1.0.0",
+                "@testing-library/react": "^14.1.0",
+                "@testing-library/jest-dom": "^6.1.0",
+                "jsdom": "^23.0.0"
+            })
+        elif tech == "playwright":
+            dev_dependencies.update({
+                "@playwright/test": "^1.40.0"
+            })
+    
+    scripts = {
+        "dev": "next dev",
+        "build": "next build",
+        "start": "next start",
+        "lint": "next lint",
+        "type-check": "tsc --noEmit"
+    }
+    
+    # Add testing scripts if testing frameworks are included
+    if any("vitest" in techs for _, techs in stack_sig):
+        scripts.update({
+            "test": "vitest",
+            "test:ui": "vitest --ui",
+            "test:coverage": "vitest --coverage"
+        })
+    
+    if any("playwright" in techs for _, techs in stack_sig):
+        scripts.update({
+            "test:e2e": "playwright test",
+            "test:e2e:ui": "playwright test --ui"
+        })
+    
+    return {
+        "name": project_name,
+        "version": "0.1.0",
+        "private": True,
+        "scripts": scripts,
+        "dependencies": dependencies,
+        "devDependencies": dev_dependencies,
+        "engines": {
+            "node": ">=20.0.0",
+            "npm": ">=10.0.0"
+        }
+    }
+
+_UPGRADE_GUIDE_HEADER = """
+# Technology Stack Upgrade Guide
+
+## Current vs Target Stack
+
+### Migration Steps
+
 """
-        
-        guide += """
+
+_UPGRADE_GUIDE_FOOTER = """
 ## Benefits of Upgrading
 
 - **Performance**: Modern technologies offer better performance
@@ -467,15 +527,16 @@ class ModernTechStackManager:
 - Have rollback procedures documented
 
 """
-        
-        return guide
 
 # Example usage and demonstration
 def main():
     """Demonstrate the tech stack upgrader"""
-    
+
+    from rich.panel import Panel
+
     manager = ModernTechStackManager()
-    
+    console = _get_console()
+
     console.print(Panel.fit(
         "🚀 Modern Tech Stack Upgrader 2030",
         style="bold green"
@@ -493,10 +554,11 @@ def main():
     package_json = manager.generate_package_json(recommended_stack, "my-saas-app")
     console.print(f"\n📦 Generated package.json with {len(package_json['dependencies'])} dependencies")
     
-    # Display technology comparison
-    all_techs = [tech for techs in recommended_stack.values() for tech in techs]
+    # Display technology comparison (only the first 5 are shown for the demo,
+    # so stop iterating once we have them)
+    all_techs = list(islice(chain.from_iterable(recommended_stack.values()), 5))
     console.print(f"\n📊 Technology Comparison:")
-    manager.display_stack_comparison(all_techs[:5])  # Show first 5 for demo
+    manager.display_stack_comparison(all_techs)
     
     # Generate project structure
     structure = manager.generate_project_structure(recommended_stack)
@@ -75,17 +75,23 @@ def demo_template_export():
     demo_dir.mkdir(exist_ok=True)
     
     templates_to_export = ["saas", "ecommerce", "blog"]
-    
+
+    # Build all (template, path) pairs first, then export in one batch write
+    exports = []
     for template_type in templates_to_export:
         template = manager.get_template(template_type, f"Demo {template_type.title()}")
         if template:
             output_path = demo_dir / f"{template_type}_spec.json"
-            if manager.export_template_spec(template, str(output_path)):
-                print(f"✅ Exported {template_type} template to {output_path}")
-                
-                # Show summary
-                summary = manager.generate_template_summary(template)
-                print(f"   📊 {summary['total_features']} features, {summary['total_pages']} pages")
+            exports.append((template_type, template, output_path))
+
+    results = manager.export_template_specs([(t, str(p)) for _, t, p in exports])
+    for (template_type, template, output_path), ok in zip(exports, results):
+        if ok:
+            print(f"✅ Exported {template_type} template to {output_path}")
+
+            # Show summary
+            summary = manager.generate_template_summary(template)
+            print(f"   📊 {summary['total_features']} features, {summary['total_pages']} pages")
 
 def demo_template_recommendations():
     """Demo: Get template recommendations."""
@@ -4,12 +4,70 @@ Diagnostic script for AI Development Team Orchestrator
 Helps identify and fix issues causing basic outputs instead of comprehensive applications.
 """
 
-import json
 import os
-import subprocess
-import requests
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 
+# requests (and psutil above) are imported lazily so running a single cheap
+# check like check_python_environment doesn't pay their import cost.
+#
+# One pooled session for every Ollama round-trip; per-call requests.get/post
+# builds a fresh Session (and TCP connection) each time.
+_SESSION = None
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return _SESSION
+
+# Prebuilt request payloads; per-call code only merges in the variable fields
+_TEST_PAYLOAD_TEMPLATE = {
+    "model": None,
+    "prompt": "Say 'Hello World'",
+    "stream": False,
+    "options": {"temperature": 0.1, "num_ctx": 100}
+}
+
+_GENERATION_PAYLOAD_TEMPLATE = {
+    "model": None,
+    "prompt": None,
+    "stream": False,
+    "options": None
+}
+
+# Required dependencies as (distribution name, import name) pairs; gitpython
+# and python-dotenv install under different module names
+_REQUIRED_DEPS = (
+    ("requests", "requests"), ("rich", "rich"), ("click", "click"),
+    ("pydantic", "pydantic"), ("jsonschema", "jsonschema"),
+    ("gitpython", "git"), ("python-dotenv", "dotenv")
+)
+
+_REQUIRED_FILES = (
+    "main.py",
+    "cli_wizard.py",
+    "requirements.txt",
+    "agents/planner.py",
+    "agents/builder.py",
+    "agents/reviewer.py",
+    "agents/fixer.py",
+    "agents/finalizer.py",
+    "agents/git_pusher.py",
+    "prompts/planner_prompt.txt",
+    "prompts/builder_prompt.txt",
+    "prompts/reviewer_prompt.txt",
+    "prompts/fixer_prompt.txt",
+    "prompts/finalizer_prompt.txt",
+    "prompts/git_pusher_prompt.txt",
+    "utils/ollama_client.py"
+)
+
 def check_ollama_status() -> Dict[str, Any]:
     """Check Ollama service status and model availability."""
     print("🔍 Checking Ollama service...")
@@ -21,20 +79,26 @@ def check_ollama_status() -> Dict[str, Any]:
         "issues": []
     }
     
+    import requests
+
     try:
         # Check if Ollama is running
-        response = requests.get("http://localhost:11434/api/tags", timeout=10)
+        response = _get_session().get("http://localhost:11434/api/tags", timeout=10)
         if response.status_code == 200:
             status["ollama_running"] = True
             models = response.json().get("models", [])
             status["models_available"] = [model["name"] for model in models]
             
-            # Test each model
-            for model in status["models_available"]:
-                if test_model_response(model):
-                    status["models_working"].append(model)
-                else:
-                    status["issues"].append(f"Model {model} is not responding properly")
+            # Test all models concurrently; each probe is a blocking network
+            # round-trip, so wall time collapses to the slowest single probe
+            if status["models_available"]:
+                with ThreadPoolExecutor(max_workers=min(8, len(status["models_available"]))) as executor:
+                    results = list(executor.map(test_model_response, status["models_available"]))
+                for model, working in zip(status["models_available"], results):
+                    if working:
+                        status["models_working"].append(model)
+                    else:
+                        status["issues"].append(f"Model {model} is not responding properly")
         else:
             status["issues"].append(f"Ollama API returned status {response.status_code}")
             
@@ -48,17 +112,9 @@ def check_ollama_status() -> Dict[str, Any]:
 def test_model_response(model: str) -> bool:
     """Test if a model can generate a response."""
     try:
-        payload = {
-            "model": model,
-            "prompt": "Say 'Hello World'",
-            "stream": False,
-            "options": {
-                "temperature": 0.1,
-                "num_ctx": 100
-            }
-        }
-        
-        response = requests.post(
+        payload = _TEST_PAYLOAD_TEMPLATE | {"model": model}
+
+        response = _get_session().post(
             "http://localhost:11434/api/generate",
             json=payload,
             timeout=30
@@ -84,33 +140,17 @@ def check_system_resources() -> Dict[str, Any]:
     }
     
     try:
-        # Check memory (Linux/Mac)
-        if os.name != 'nt':  # Not Windows
-            result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                if len(lines) > 1:
-                    mem_line = lines[1].split()
-                    if len(mem_line) > 1:
-                        resources["memory_available"] = mem_line[1]
-        
-        # Check disk space
-        if os.name != 'nt':
-            result = subprocess.run(['df', '-h', '.'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                if len(lines) > 1:
-                    disk_line = lines[1].split()
-                    if len(disk_line) > 3:
-                        resources["disk_space"] = disk_line[3]
-        
-        # Check CPU cores
-        import multiprocessing
-        resources["cpu_cores"] = str(multiprocessing.cpu_count())
-        
+        # psutil reads /proc (or the platform equivalent) directly — no
+        # fork/exec of free/df and no fragile stdout parsing, and it works
+        # on Windows too
+        import psutil
+        resources["memory_available"] = f"{psutil.virtual_memory().available / 2**30:.1f}G"
+        resources["disk_space"] = f"{psutil.disk_usage('.').free / 2**30:.1f}G"
+        resources["cpu_cores"] = str(os.cpu_count())
+
     except Exception as e:
         resources["issues"].append(f"Error checking resources: {e}")
-    
+
     return resources
 
 def check_python_environment() -> Dict[str, Any]:
@@ -129,17 +169,13 @@ def check_python_environment() -> Dict[str, Any]:
         import sys
         env["python_version"] = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
         
-        # Check required dependencies
-        required_deps = [
-            "requests", "rich", "click", "pydantic", 
-            "jsonschema", "gitpython", "python-dotenv"
-        ]
-        
-        for dep in required_deps:
-            try:
-                __import__(dep)
+        # Check required dependencies without executing their module code;
+        # find_spec only consults the import machinery
+        import importlib.util
+        for dep, module_name in _REQUIRED_DEPS:
+            if importlib.util.find_spec(module_name) is not None:
                 env["dependencies_installed"].append(dep)
-            except ImportError:
+            else:
                 env["missing_dependencies"].append(dep)
         
         if env["missing_dependencies"]:
@@ -160,27 +196,16 @@ def check_project_structure() -> Dict[str, Any]:
         "issues": []
     }
     
-    required_files = [
-        "main.py",
-        "cli_wizard.py",
-        "requirements.txt",
-        "agents/planner.py",
-        "agents/builder.py",
-        "agents/reviewer.py",
-        "agents/fixer.py",
-        "agents/finalizer.py",
-        "agents/git_pusher.py",
-        "prompts/planner_prompt.txt",
-        "prompts/builder_prompt.txt",
-        "prompts/reviewer_prompt.txt",
-        "prompts/fixer_prompt.txt",
-        "prompts/finalizer_prompt.txt",
-        "prompts/git_pusher_prompt.txt",
-        "utils/ollama_client.py"
-    ]
-    
-    for file_path in required_files:
-        if os.path.exists(file_path):
+    # One directory listing per parent instead of one stat() per file
+    listings = {}
+    for file_path in _REQUIRED_FILES:
+        directory = os.path.dirname(file_path) or "."
+        if directory not in listings:
+            try:
+                listings[directory] = {entry.name for entry in os.scandir(directory)}
+            except OSError:
+                listings[directory] = set()
+        if os.path.basename(file_path) in listings[directory]:
             structure["files_present"].append(file_path)
         else:
             structure["files_missing"].append(file_path)
@@ -199,95 +224,77 @@ def test_model_generation() -> Dict[str, Any]:
         "builder_test": {"success": False, "response_length": 0, "error": None},
         "issues": []
     }
-    
-    try:
-        # Test planner model
-        planner_prompt = "Create a simple technical specification for a todo app."
-        payload = {
-            "model": "llama2:7b-chat",
-            "prompt": planner_prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.3,
-                "num_ctx": 2000
-            }
-        }
-        
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json=payload,
-            timeout=60
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            response_text = result.get("response", "")
-            test_results["planner_test"]["success"] = True
-            test_results["planner_test"]["response_length"] = len(response_text)
-            
-            if len(response_text) < 100:
-                test_results["issues"].append("Planner model generated very short response")
-        else:
-            test_results["planner_test"]["error"] = f"HTTP {response.status_code}"
-            
-    except Exception as e:
-        test_results["planner_test"]["error"] = str(e)
-        test_results["issues"].append(f"Planner test failed: {e}")
-    
-    try:
-        # Test builder model
-        builder_prompt = "Create a simple React component for a button."
-        payload = {
-            "model": "deepseek-coder:33b",
-            "prompt": builder_prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.2,
-                "num_ctx": 2000
+
+    def run_test(label: str, model: str, prompt: str, temperature: float, min_length: int):
+        result = {"success": False, "response_length": 0, "error": None}
+        issues = []
+        try:
+            payload = _GENERATION_PAYLOAD_TEMPLATE | {
+                "model": model,
+                "prompt": prompt,
+                "options": {"temperature": temperature, "num_ctx": 2000}
             }
-        }
-        
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json=payload,
-            timeout=60
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            response_text = result.get("response", "")
-            test_results["builder_test"]["success"] = True
-            test_results["builder_test"]["response_length"] = len(response_text)
-            
-            if len(response_text) < 50:
-                test_results["issues"].append("Builder model generated very short response")
-        else:
-            test_results["builder_test"]["error"] = f"HTTP {response.status_code}"
-            
-    except Exception as e:
-        test_results["builder_test"]["error"] = str(e)
-        test_results["issues"].append(f"Builder test failed: {e}")
-    
+
+            response = _get_session().post(
+                "http://localhost:11434/api/generate",
+                json=payload,
+                timeout=60
+            )
+
+            if response.status_code == 200:
+                response_text = response.json().get("response", "")
+                result["success"] = True
+                result["response_length"] = len(response_text)
+
+                if len(response_text) < min_length:
+                    issues.append(f"{label} model generated very short response")
+            else:
+                result["error"] = f"HTTP {response.status_code}"
+
+        except Exception as e:
+            result["error"] = str(e)
+            issues.append(f"{label} test failed: {e}")
+
+        return result, issues
+
+    # The two probes are independent 60s round-trips; run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        planner_future = executor.submit(
+            run_test, "Planner", "llama2:7b-chat",
+            "Create a simple technical specification for a todo app.", 0.3, 100)
+        builder_future = executor.submit(
+            run_test, "Builder", "deepseek-coder:33b",
+            "Create a simple React component for a button.", 0.2, 50)
+
+    for key, future in (("planner_test", planner_future), ("builder_test", builder_future)):
+        result, issues = future.result()
+        test_results[key] = result
+        test_results["issues"].extend(issues)
+
     return test_results
 
+# Compiled once; each issue is classified in a single scan instead of up to
+# five sequential substring tests (plus a .lower() allocation) per issue
+_FIX_PATTERNS = [
+    (re.compile(r"Ollama service is not running"), "🔧 Start Ollama: ollama serve"),
+    (re.compile(r"Model.*not responding"), "🔧 Re-pull the problematic model: ollama pull <model-name>"),
+    (re.compile(r"Missing dependencies"), "🔧 Install missing dependencies: pip install -r requirements.txt"),
+    (re.compile(r"very short response"), "🔧 Increase model context or try different temperature settings"),
+    (re.compile(r"timeout", re.IGNORECASE), "🔧 Increase timeout settings or reduce prompt size"),
+]
+
 def generate_fixes(issues: List[str]) -> List[str]:
     """Generate fix suggestions based on identified issues."""
     fixes = []
-    
+
     for issue in issues:
-        if "Ollama service is not running" in issue:
-            fixes.append("🔧 Start Ollama: ollama serve")
-        elif "Model" in issue and "not responding" in issue:
-            fixes.append("🔧 Re-pull the problematic model: ollama pull <model-name>")
-        elif "Missing dependencies" in issue:
-            fixes.append("🔧 Install missing dependencies: pip install -r requirements.txt")
-        elif "very short response" in issue:
-            fixes.append("🔧 Increase model context or try different temperature settings")
-        elif "timeout" in issue.lower():
-            fixes.append("🔧 Increase timeout settings or reduce prompt size")
+        for pattern, fix in _FIX_PATTERNS:
+            if pattern.search(issue):
+                fixes.append(fix)
+                break
         else:
             fixes.append(f"🔧 Investigate: {issue}")
-    
+
     return fixes
 
 def main():
@@ -313,58 +320,60 @@ def main():
     # Generate fixes
     fixes = generate_fixes(all_issues)
     
-    # Print results
-    print("\n📊 DIAGNOSTIC RESULTS")
-    print("=" * 60)
-    
-    print(f"\n🤖 Ollama Status:")
-    print(f"  Running: {'✅' if ollama_status['ollama_running'] else '❌'}")
-    print(f"  Available Models: {', '.join(ollama_status['models_available'])}")
-    print(f"  Working Models: {', '.join(ollama_status['models_working'])}")
-    
-    print(f"\n💻 System Resources:")
-    print(f"  Memory: {system_resources['memory_available']}")
-    print(f"  Disk Space: {system_resources['disk_space']}")
-    print(f"  CPU Cores: {system_resources['cpu_cores']}")
-    
-    print(f"\n🐍 Python Environment:")
-    print(f"  Version: {python_env['python_version']}")
-    print(f"  Dependencies: {len(python_env['dependencies_installed'])}/{len(python_env['dependencies_installed']) + len(python_env['missing_dependencies'])} installed")
-    
-    print(f"\n📁 Project Structure:")
-    print(f"  Files Present: {len(project_structure['files_present'])}/{len(project_structure['files_present']) + len(project_structure['files_missing'])}")
-    
-    print(f"\n🧪 Model Tests:")
-    print(f"  Planner: {'✅' if model_tests['planner_test']['success'] else '❌'} ({model_tests['planner_test']['response_length']} chars)")
-    print(f"  Builder: {'✅' if model_tests['builder_test']['success'] else '❌'} ({model_tests['builder_test']['response_length']} chars)")
-    
+    # Print results: build the whole report and emit it with one write
+    # instead of ~30 line-buffered print syscalls
+    lines = []
+    lines.append("\n📊 DIAGNOSTIC RESULTS")
+    lines.append("=" * 60)
+
+    lines.append(f"\n🤖 Ollama Status:")
+    lines.append(f"  Running: {'✅' if ollama_status['ollama_running'] else '❌'}")
+    lines.append(f"  Available Models: {', '.join(ollama_status['models_available'])}")
+    lines.append(f"  Working Models: {', '.join(ollama_status['models_working'])}")
+
+    lines.append(f"\n💻 System Resources:")
+    lines.append(f"  Memory: {system_resources['memory_available']}")
+    lines.append(f"  Disk Space: {system_resources['disk_space']}")
+    lines.append(f"  CPU Cores: {system_resources['cpu_cores']}")
+
+    lines.append(f"\n🐍 Python Environment:")
+    lines.append(f"  Version: {python_env['python_version']}")
+    lines.append(f"  Dependencies: {len(python_env['dependencies_installed'])}/{len(_REQUIRED_DEPS)} installed")
+
+    lines.append(f"\n📁 Project Structure:")
+    lines.append(f"  Files Present: {len(project_structure['files_present'])}/{len(_REQUIRED_FILES)}")
+
+    lines.append(f"\n🧪 Model Tests:")
+    lines.append(f"  Planner: {'✅' if model_tests['planner_test']['success'] else '❌'} ({model_tests['planner_test']['response_length']} chars)")
+    lines.append(f"  Builder: {'✅' if model_tests['builder_test']['success'] else '❌'} ({model_tests['builder_test']['response_length']} chars)")
+
     if all_issues:
-        print(f"\n❌ ISSUES FOUND ({len(all_issues)}):")
-        for i, issue in enumerate(all_issues, 1):
-            print(f"  {i}. {issue}")
-        
-        print(f"\n🔧 RECOMMENDED FIXES:")
-        for i, fix in enumerate(fixes, 1):
-            print(f"  {i}. {fix}")
-        
-        print(f"\n💡 QUICK FIXES:")
-        print("  1. Restart Ollama: pkill ollama && ollama serve")
-        print("  2. Re-pull models: ollama pull llama2:7b-chat && ollama pull deepseek-coder:33b")
-        print("  3. Check system resources (RAM, disk space)")
-        print("  4. Verify all project files are present")
-        
+        lines.append(f"\n❌ ISSUES FOUND ({len(all_issues)}):")
+        lines.extend(f"  {i}. {issue}" for i, issue in enumerate(all_issues, 1))
+
+        lines.append(f"\n🔧 RECOMMENDED FIXES:")
+        lines.extend(f"  {i}. {fix}" for i, fix in enumerate(fixes, 1))
+
+        lines.append(f"\n💡 QUICK FIXES:")
+        lines.append("  1. Restart Ollama: pkill ollama && ollama serve")
+        lines.append("  2. Re-pull models: ollama pull llama2:7b-chat && ollama pull deepseek-coder:33b")
+        lines.append("  3. Check system resources (RAM, disk space)")
+        lines.append("  4. Verify all project files are present")
+
     else:
-        print(f"\n✅ No issues found! Your setup should work correctly.")
-        print("If you're still getting basic outputs, try:")
-        print("  1. Increase timeout settings in ollama_client.py")
-        print("  2. Reduce max_tokens to avoid timeouts")
-        print("  3. Check if models are generating proper responses")
-    
-    print(f"\n📝 Next Steps:")
-    print("  1. Apply the recommended fixes above")
-    print("  2. Run this diagnostic again to verify fixes")
-    print("  3. Try running the orchestrator: python main.py")
-    print("  4. Monitor the output for specific error messages")
+        lines.append(f"\n✅ No issues found! Your setup should work correctly.")
+        lines.append("If you're still getting basic outputs, try:")
+        lines.append("  1. Increase timeout settings in ollama_client.py")
+        lines.append("  2. Reduce max_tokens to avoid timeouts")
+        lines.append("  3. Check if models are generating proper responses")
+
+    lines.append(f"\n📝 Next Steps:")
+    lines.append("  1. Apply the recommended fixes above")
+    lines.append("  2. Run this diagnostic again to verify fixes")
+    lines.append("  3. Try running the orchestrator: python main.py")
+    lines.append("  4. Monitor the output for specific error messages")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -10,19 +10,16 @@ This module adds sophisticated capabilities for:
 
 import json
 import re
+from functools import cached_property
+from types import MappingProxyType
 from typing import Dict, List, Any
 
 class CulturalDesignEnhancer:
     """Enhanced prompting system for culturally-aware, professional websites"""
-    
-    def __init__(self):
-        self.cultural_templates = self._load_cultural_templates()
-        self.design_frameworks = self._load_design_frameworks()
-        self.animation_libraries = self._load_animation_libraries()
-    
-    def _load_cultural_templates(self) -> Dict[str, Any]:
-        """Load cultural design templates and patterns"""
-        return {
+
+    # These templates are pure constants; keeping them at class level means
+    # every instance shares one copy and construction does no dict building.
+    CULTURAL_TEMPLATES: Dict[str, Any] = MappingProxyType({
             'arabic': {
                 'fonts': ['Cairo', 'Almarai', 'Amiri', 'Scheherazade'],
                 'colors': {
@@ -46,21 +43,17 @@ class CulturalDesignEnhancer:
                 'desert_colors': ['#f5f3f0', '#e8dcc0', '#d4c4a0'],
                 'traditional_crafts': 'Pottery, textiles, metalwork patterns'
             }
-        }
-    
-    def _load_design_frameworks(self) -> Dict[str, str]:
-        """Advanced CSS frameworks and design systems"""
-        return {
+        })
+
+    DESIGN_FRAMEWORKS: Dict[str, str] = MappingProxyType({
             'tailwind': 'TailwindCSS for utility-first responsive design',
             'glass_morphism': 'Glass morphism effects with backdrop-filter',
             'gradient_systems': 'Complex gradient color systems',
             'animation_frameworks': 'GSAP, Framer Motion, CSS animations',
             'typography': 'Advanced typography with cultural fonts'
-        }
-    
-    def _load_animation_libraries(self) -> Dict[str, str]:
-        """3D and animation library templates"""
-        return {
+        })
+
+    ANIMATION_LIBRARIES: Dict[str, str] = MappingProxyType({
             'threejs': """
                 // Three.js setup for agricultural 3D scenes
                 const scene = new THREE.Scene();
@@ -76,12 +69,18 @@ class CulturalDesignEnhancer:
             """,
             'lottie': 'Lottie animations for micro-interactions',
             'scroll_animations': 'Intersection Observer for scroll-triggered animations'
-        }
+        })
 
-    def enhance_arabic_marketplace_prompt(self, base_prompt: str) -> str:
-        """Enhanced prompting for Arabic marketplace websites"""
-        
-        cultural_enhancement = f"""
+    def __init__(self):
+        self.cultural_templates = self.CULTURAL_TEMPLATES
+        self.design_frameworks = self.DESIGN_FRAMEWORKS
+        self.animation_libraries = self.ANIMATION_LIBRARIES
+        self._prompt_cache: Dict[tuple, str] = {}
+
+    @cached_property
+    def _cultural_enhancement(self) -> str:
+        """Arabic marketplace requirements block (independent of the base prompt)"""
+        return f"""
         
         CULTURAL REQUIREMENTS (CRITICAL):
         1. **Arabic Language Integration**:
@@ -131,13 +130,15 @@ class CulturalDesignEnhancer:
         - Agricultural industry expertise
         - Modern tech aesthetic with traditional respect
         """
-        
-        return base_prompt + cultural_enhancement
 
-    def enhance_3d_animation_prompt(self, base_prompt: str) -> str:
-        """Add sophisticated 3D animation requirements"""
-        
-        animation_enhancement = f"""
+    def enhance_arabic_marketplace_prompt(self, base_prompt: str) -> str:
+        """Enhanced prompting for Arabic marketplace websites"""
+        return base_prompt + self._cultural_enhancement
+
+    @cached_property
+    def _animation_enhancement(self) -> str:
+        """3D animation requirements block (independent of the base prompt)"""
+        return f"""
         
         3D ANIMATION REQUIREMENTS (CRITICAL):
         1. **Three.js Implementation**:
@@ -161,13 +162,15 @@ class CulturalDesignEnhancer:
            - Smooth transitions between sections
            - Parallax effects with 3D elements
         """
-        
-        return base_prompt + animation_enhancement
 
-    def enhance_professional_design_prompt(self, base_prompt: str) -> str:
-        """Add professional design standards"""
-        
-        design_enhancement = f"""
+    def enhance_3d_animation_prompt(self, base_prompt: str) -> str:
+        """Add sophisticated 3D animation requirements"""
+        return base_prompt + self._animation_enhancement
+
+    @cached_property
+    def _design_enhancement(self) -> str:
+        """Professional design standards block (independent of the base prompt)"""
+        return f"""
         
         PROFESSIONAL DESIGN STANDARDS (CRITICAL):
         1. **Visual Hierarchy**:
@@ -195,12 +198,21 @@ class CulturalDesignEnhancer:
            - Professional icon usage
            - High-quality imagery placeholders
         """
-        
-        return base_prompt + design_enhancement
+
+    def enhance_professional_design_prompt(self, base_prompt: str) -> str:
+        """Add professional design standards"""
+        return base_prompt + self._design_enhancement
 
     def create_enhanced_prompt(self, original_prompt: str, website_type: str = "marketplace") -> str:
         """Create a fully enhanced prompt for sophisticated websites"""
-        
+
+        # Deterministic in its arguments; agent retry loops frequently resend
+        # the same prompt, so memoize per instance
+        cache_key = (original_prompt, website_type)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         enhanced_prompt = original_prompt
         
         # Apply all enhancements
@@ -223,8 +235,10 @@ class CulturalDesignEnhancer:
         
         OUTPUT: Single HTML file with embedded CSS/JS, ready for deployment.
         """
-        
-        return enhanced_prompt + technical_footer
+
+        result = enhanced_prompt + technical_footer
+        self._prompt_cache[cache_key] = result
+        return result
 
 def test_cultural_enhancement():
     """Test the cultural enhancement system"""
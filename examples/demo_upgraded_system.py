@@ -8,34 +8,202 @@ Demo of the Upgraded +++A Project Builder 2030
 """
 
 import asyncio
+import io
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 import json
-from pathlib import Path
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.layout import Layout
-from rich.live import Live
-import time
-
-# Import our upgraded modules
-from multi_agent_system import MultiAgentOrchestrator
-from api_integration_system import APIIntegrationManager
-from tech_stack_upgrader import ModernTechStackManager
-from deployment_system import ModernDeploymentSystem
 
 console = Console()
 
+
+def _dumps(obj) -> bytes:
+    """Serialize configs with orjson when available (2-5x faster than the
+    stdlib), falling back to json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Static showcase tables, allocated once at import instead of per call.
+
+ARCHITECTURE_ROWS = (
+    ("Multi-Agent System", "OpenAI GPT-4o + Anthropic Claude", "Specialized AI agents for different tasks", "✅ Active"),
+    ("API Integration", "20+ Service Integrations", "Auth, Payments, Analytics, Email, Storage", "✅ Active"),
+    ("Tech Stack", "React 18 + Next.js 14 + TypeScript 5", "Modern frontend with server components", "✅ Active"),
+    ("Backend", "Node.js 20 + Fastify + tRPC", "Type-safe APIs with high performance", "✅ Active"),
+    ("Database", "PostgreSQL 16 + Prisma + Redis", "Modern database with ORM and caching", "✅ Active"),
+    ("Deployment", "Docker + Kubernetes + CI/CD", "Production-ready containerization", "✅ Active"),
+    ("Monitoring", "Prometheus + Grafana + Alerts", "Real-time monitoring and alerting", "✅ Active"),
+    ("Security", "JWT + RBAC + Rate Limiting", "Enterprise-grade security features", "✅ Active"),
+)
+
+# (name, description, example) triples for the advanced-features showcase
+ADVANCED_FEATURES = (
+    ("🤖 AI-Powered Code Generation",
+     "6 specialized AI agents generate production-ready code",
+     "Automatic API endpoint generation with validation & error handling"),
+    ("🔐 Enterprise Security",
+     "JWT authentication, RBAC, rate limiting, security headers",
+     "Auto-configured Auth0 integration with user management"),
+    ("💳 Payment Processing",
+     "Stripe, PayPal, Lemon Squeezy integrations",
+     "Complete checkout flow with subscription management"),
+    ("📊 Real-time Analytics",
+     "Google Analytics, Mixpanel, PostHog integration",
+     "User behavior tracking with conversion funnels"),
+    ("🌍 Global Deployment",
+     "Multi-cloud, multi-region deployment capabilities",
+     "AWS + Kubernetes auto-scaling across 3 regions"),
+    ("🧪 Quality Assurance",
+     "Automated testing, security scanning, performance monitoring",
+     "100% test coverage with E2E scenarios"),
+    ("🎨 Cultural Design",
+     "RTL support, cultural patterns, international fonts",
+     "Arabic marketplace with Islamic geometric patterns"),
+    ("🚀 Performance Optimization",
+     "Image optimization, code splitting, CDN integration",
+     "Sub-second load times with 95+ Lighthouse scores"),
+)
+
+COST_COMPARISONS = (
+    ("Development Time", "3-6 months", "1-2 days", "95% faster"),
+    ("Cost", "$50,000 - $200,000", "$100 - $500", "99% cheaper"),
+    ("Team Size", "5-10 developers", "1 person + AI", "90% smaller"),
+    ("Maintenance", "$5,000/month", "$50/month", "99% cheaper"),
+    ("Quality", "Variable", "Enterprise-grade", "Consistent"),
+    ("Updates", "Weeks to deploy", "Minutes to deploy", "1000x faster"),
+    ("Scalability", "Manual scaling", "Auto-scaling", "Infinite"),
+    ("Security", "Manual audits", "Built-in security", "24/7 protection"),
+)
+
+# (path, description) pairs for the file-generation showcase. Built once at
+# import as structured data instead of "path - desc" strings split per row.
+FILES_GENERATED = (
+    # Frontend files
+    ("src/app/page.tsx", "Modern Next.js homepage with server components"),
+    ("src/components/ui/button.tsx", "shadcn/ui button component"),
+    ("src/lib/auth.ts", "Authentication configuration"),
+    ("src/hooks/useAuth.ts", "Custom authentication hook"),
+
+    # Backend files
+    ("src/app/api/auth/route.ts", "Authentication API endpoints"),
+    ("src/app/api/payments/route.ts", "Stripe payment integration"),
+    ("src/server/routers/user.ts", "tRPC user management"),
+    ("src/lib/db.ts", "Prisma database client"),
+
+    # Configuration files
+    ("package.json", "Modern dependencies and scripts"),
+    ("tsconfig.json", "Strict TypeScript configuration"),
+    ("tailwind.config.js", "Design system configuration"),
+    ("next.config.js", "Optimized Next.js settings"),
+
+    # Database files
+    ("prisma/schema.prisma", "Complete database schema"),
+    ("prisma/migrations/", "Database migration files"),
+    ("prisma/seed.ts", "Development data seeding"),
+
+    # Deployment files
+    ("Dockerfile", "Multi-stage production container"),
+    ("docker-compose.yml", "Development environment"),
+    ("k8s/deployment.yaml", "Kubernetes manifests"),
+    (".github/workflows/ci-cd.yml", "Complete CI/CD pipeline"),
+
+    # Testing files
+    ("tests/unit/components.test.tsx", "Component unit tests"),
+    ("tests/e2e/auth.spec.ts", "Authentication E2E tests"),
+    ("vitest.config.ts", "Modern testing configuration"),
+    ("playwright.config.ts", "E2E testing setup"),
+
+    # Documentation
+    ("README.md", "Complete setup and deployment guide"),
+    ("docs/api.md", "API documentation"),
+    ("docs/deployment.md", "Deployment instructions"),
+)
+
 class UpgradedProjectBuilderDemo:
     """Demonstrates the complete +++A Project Builder 2030 system"""
     
     def __init__(self):
         self.console = console
-        self.orchestrator = MultiAgentOrchestrator()
-        self.api_manager = APIIntegrationManager()
-        self.tech_manager = ModernTechStackManager()
-        self.deployment_system = ModernDeploymentSystem()
-    
+        # Manager modules drag in heavy SDKs (openai, anthropic, stripe),
+        # so they are imported lazily on first use to keep cold start fast
+        self._orchestrator = None
+        self._api_manager = None
+        self._tech_manager = None
+        self._deployment_system = None
+        # Serialized generation results keyed by project description, so
+        # rerunning the same project in one session is a cache hit
+        self._config_cache = {}
+
+    @property
+    def orchestrator(self):
+        if self._orchestrator is None:
+            from multi_agent_system import MultiAgentOrchestrator
+            self._orchestrator = MultiAgentOrchestrator()
+        return self._orchestrator
+
+    @property
+    def api_manager(self):
+        if self._api_manager is None:
+            from api_integration_system import APIIntegrationManager
+            self._api_manager = APIIntegrationManager()
+        return self._api_manager
+
+    @property
+    def tech_manager(self):
+        if self._tech_manager is None:
+            from tech_stack_upgrader import ModernTechStackManager
+            self._tech_manager = ModernTechStackManager()
+        return self._tech_manager
+
+    @property
+    def deployment_system(self):
+        if self._deployment_system is None:
+            from deployment_system import ModernDeploymentSystem
+            self._deployment_system = ModernDeploymentSystem()
+        return self._deployment_system
+
+    @staticmethod
+    def _make_table(console, title, style, columns, rows):
+        """Build a rich Table only when attached to a terminal.
+
+        Table layout is O(rows x cols) with width measurement and style
+        resolution per cell — wasted work when stdout is redirected to CI
+        logs or a file. Off-terminal, emit plain tab-separated text instead.
+        """
+        if console.is_terminal:
+            table = Table(title=title, style=style)
+            for header, col_style, width in columns:
+                table.add_column(header, style=col_style, width=width)
+            for row in rows:
+                table.add_row(*row)
+            return table
+        lines = [title]
+        lines.extend("\t".join(row) for row in rows)
+        return "\n".join(lines)
+
+    def _print_section(self, *renderables):
+        """Flush a logical section as one console.print call.
+
+        console.print re-parses markup and recomputes ANSI state per call, so
+        grouping a section's renderables is much cheaper than printing each
+        panel/table separately.
+        """
+        self.console.print(Group(*renderables))
+
     def display_welcome(self):
         """Display welcome screen with system capabilities"""
         
@@ -63,43 +231,39 @@ The most advanced AI-powered project generation system capable of building:
     def display_system_architecture(self):
         """Display the system architecture overview"""
         
-        table = Table(title="🏗️ System Architecture Overview", style="cyan")
-        table.add_column("Component", style="magenta", width=20)
-        table.add_column("Technology", style="yellow", width=25)
-        table.add_column("Capability", style="green", width=40)
-        table.add_column("Status", style="blue", width=10)
-        
-        components = [
-            ["Multi-Agent System", "OpenAI GPT-4o + Anthropic Claude", "Specialized AI agents for different tasks", "✅ Active"],
-            ["API Integration", "20+ Service Integrations", "Auth, Payments, Analytics, Email, Storage", "✅ Active"],
-            ["Tech Stack", "React 18 + Next.js 14 + TypeScript 5", "Modern frontend with server components", "✅ Active"],
-            ["Backend", "Node.js 20 + Fastify + tRPC", "Type-safe APIs with high performance", "✅ Active"],
-            ["Database", "PostgreSQL 16 + Prisma + Redis", "Modern database with ORM and caching", "✅ Active"],
-            ["Deployment", "Docker + Kubernetes + CI/CD", "Production-ready containerization", "✅ Active"],
-            ["Monitoring", "Prometheus + Grafana + Alerts", "Real-time monitoring and alerting", "✅ Active"],
-            ["Security", "JWT + RBAC + Rate Limiting", "Enterprise-grade security features", "✅ Active"]
-        ]
-        
-        for component in components:
-            table.add_row(*component)
-        
+        table = self._make_table(
+            self.console, "🏗️ System Architecture Overview", "cyan",
+            (("Component", "magenta", 20), ("Technology", "yellow", 25),
+             ("Capability", "green", 40), ("Status", "blue", 10)),
+            ARCHITECTURE_ROWS,
+        )
         self.console.print(table)
     
-    async def demo_project_generation(self, project_description: str):
-        """Demonstrate complete project generation"""
-        
-        self.console.print(Panel.fit(
+    async def demo_project_generation(self, project_description: str, console: Console = None):
+        """Demonstrate complete project generation
+
+        Accepts an optional console so concurrent generations can each render
+        into their own capture console without interleaving output.
+        """
+        console = console or self.console
+
+        cached = self._config_cache.get(project_description)
+        if cached is not None:
+            console.print(f"♻️ Reusing cached generation for: {project_description}")
+            return _loads(cached)
+
+        console.print(Panel.fit(
             f"🔥 GENERATING: {project_description}",
             style="bold red"
         ))
         
         # Phase 1: Multi-Agent System
-        self.console.print("\n📊 Phase 1: Multi-Agent Analysis & Planning")
-        
+        console.print("\n📊 Phase 1: Multi-Agent Analysis & Planning")
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=self.console
+            console=console
         ) as progress:
             
             # Simulate multi-agent system
@@ -112,54 +276,53 @@ The most advanced AI-powered project generation system capable of building:
                 ("🧪 QUALITY", "Setting up testing and monitoring frameworks")
             ]
             
-            for agent_name, description in agents:
+            # The agents are independent, so run their simulated work
+            # concurrently: wall time drops from 6 x 1.5s to ~1.5s
+            async def run_agent(agent_name: str, description: str):
                 task = progress.add_task(f"[green]{agent_name}[/green] {description}")
                 await asyncio.sleep(1.5)  # Simulate processing time
                 progress.update(task, completed=100)
+
+            await asyncio.gather(*(run_agent(name, desc) for name, desc in agents))
         
         # Phase 2: API Integration Selection
-        self.console.print("\n🔌 Phase 2: API Integration & Third-Party Services")
+        console.print("\n🔌 Phase 2: API Integration & Third-Party Services")
         
         # Determine project type for API recommendations
         project_type = "saas" if "saas" in project_description.lower() else "marketplace" if "marketplace" in project_description.lower() else "portfolio"
         
         recommendations = self.api_manager.get_recommended_services(project_type, "startup")
         
-        api_table = Table(title="Recommended API Integrations", style="blue")
-        api_table.add_column("Service Type", style="cyan")
-        api_table.add_column("Recommended", style="yellow")
-        api_table.add_column("Integration", style="green")
-        
-        for service_type, services in recommendations.items():
-            api_table.add_row(
-                service_type.title(),
-                ", ".join(services[:2]),  # Show first 2 recommendations
-                "✅ Auto-configured"
-            )
-        
-        self.console.print(api_table)
-        
+        api_table = self._make_table(
+            console, "Recommended API Integrations", "blue",
+            (("Service Type", "cyan", None), ("Recommended", "yellow", None),
+             ("Integration", "green", None)),
+            [
+                # Show first 2 recommendations
+                (service_type.title(), ", ".join(services[:2]), "✅ Auto-configured")
+                for service_type, services in recommendations.items()
+            ],
+        )
+        console.print(api_table)
+
         # Phase 3: Tech Stack Selection
-        self.console.print("\n💻 Phase 3: Modern Tech Stack Configuration")
+        console.print("\n💻 Phase 3: Modern Tech Stack Configuration")
         
         recommended_stack = self.tech_manager.get_recommended_stack(project_type, "intermediate")
         
-        tech_table = Table(title="Technology Stack", style="magenta")
-        tech_table.add_column("Category", style="cyan")
-        tech_table.add_column("Technologies", style="yellow")
-        tech_table.add_column("Version", style="green")
-        
-        for category, techs in recommended_stack.items():
-            tech_table.add_row(
-                category.title(),
-                ", ".join(techs),
-                "Latest"
-            )
-        
-        self.console.print(tech_table)
-        
+        tech_table = self._make_table(
+            console, "Technology Stack", "magenta",
+            (("Category", "cyan", None), ("Technologies", "yellow", None),
+             ("Version", "green", None)),
+            [
+                (category.title(), ", ".join(techs), "Latest")
+                for category, techs in recommended_stack.items()
+            ],
+        )
+        console.print(tech_table)
+
         # Phase 4: Deployment Configuration
-        self.console.print("\n🚀 Phase 4: Production Deployment Setup")
+        console.print("\n🚀 Phase 4: Production Deployment Setup")
         
         deployment_configs = {
             "Docker": "Multi-stage optimized containers",
@@ -169,82 +332,40 @@ The most advanced AI-powered project generation system capable of building:
             "Infrastructure": "Terraform AWS/GCP provisioning"
         }
         
-        deploy_table = Table(title="Deployment Configuration", style="red")
-        deploy_table.add_column("Component", style="cyan")
-        deploy_table.add_column("Configuration", style="yellow")
-        deploy_table.add_column("Status", style="green")
-        
-        for component, config in deployment_configs.items():
-            deploy_table.add_row(component, config, "✅ Generated")
-        
-        self.console.print(deploy_table)
-        
-        return {
+        deploy_table = self._make_table(
+            console, "Deployment Configuration", "red",
+            (("Component", "cyan", None), ("Configuration", "yellow", None),
+             ("Status", "green", None)),
+            [
+                (component, config, "✅ Generated")
+                for component, config in deployment_configs.items()
+            ],
+        )
+        console.print(deploy_table)
+
+        configs = {
             "apis": recommendations,
             "tech_stack": recommended_stack,
             "deployment": deployment_configs
         }
+        # Cache the serialized form: cheap with orjson, and hits hand back an
+        # independent copy so callers can mutate their configs freely
+        self._config_cache[project_description] = _dumps(configs)
+        return configs
     
     def demo_file_generation(self, project_name: str, configs: dict):
         """Demonstrate file generation capabilities"""
         
         self.console.print(f"\n📁 Phase 5: Project File Generation for '{project_name}'")
         
-        files_generated = [
-            # Frontend files
-            "src/app/page.tsx - Modern Next.js homepage with server components",
-            "src/components/ui/button.tsx - shadcn/ui button component",
-            "src/lib/auth.ts - Authentication configuration",
-            "src/hooks/useAuth.ts - Custom authentication hook",
-            
-            # Backend files
-            "src/app/api/auth/route.ts - Authentication API endpoints",
-            "src/app/api/payments/route.ts - Stripe payment integration",
-            "src/server/routers/user.ts - tRPC user management",
-            "src/lib/db.ts - Prisma database client",
-            
-            # Configuration files
-            "package.json - Modern dependencies and scripts",
-            "tsconfig.json - Strict TypeScript configuration",
-            "tailwind.config.js - Design system configuration",
-            "next.config.js - Optimized Next.js settings",
-            
-            # Database files
-            "prisma/schema.prisma - Complete database schema",
-            "prisma/migrations/ - Database migration files",
-            "prisma/seed.ts - Development data seeding",
-            
-            # Deployment files
-            "Dockerfile - Multi-stage production container",
-            "docker-compose.yml - Development environment",
-            "k8s/deployment.yaml - Kubernetes manifests",
-            ".github/workflows/ci-cd.yml - Complete CI/CD pipeline",
-            
-            # Testing files
-            "tests/unit/components.test.tsx - Component unit tests",
-            "tests/e2e/auth.spec.ts - Authentication E2E tests",
-            "vitest.config.ts - Modern testing configuration",
-            "playwright.config.ts - E2E testing setup",
-            
-            # Documentation
-            "README.md - Complete setup and deployment guide",
-            "docs/api.md - API documentation",
-            "docs/deployment.md - Deployment instructions"
-        ]
-        
-        files_table = Table(title=f"Generated Files for {project_name}", style="green")
-        files_table.add_column("File", style="cyan", width=35)
-        files_table.add_column("Description", style="yellow", width=50)
-        files_table.add_column("Status", style="green", width=10)
-        
-        for file_info in files_generated:
-            file_path, description = file_info.split(" - ", 1)
-            files_table.add_row(file_path, description, "✅")
-        
-        self.console.print(files_table)
-        
+        files_table = self._make_table(
+            self.console, f"Generated Files for {project_name}", "green",
+            (("File", "cyan", 35), ("Description", "yellow", 50),
+             ("Status", "green", 10)),
+            [(file_path, description, "✅") for file_path, description in FILES_GENERATED],
+        )
+
         # Show project structure
-        self.console.print(f"\n🗂️ Project Structure for {project_name}:")
         project_structure = f"""
 {project_name}/
 ├── 📁 src/
@@ -263,88 +384,34 @@ The most advanced AI-powered project generation system capable of building:
 ├── ⚙️ package.json          # Dependencies & scripts
 └── 📚 README.md             # Documentation
 """
-        self.console.print(project_structure)
+        self._print_section(files_table, f"\n🗂️ Project Structure for {project_name}:", project_structure)
     
-    def demo_advanced_features(self):
+    async def demo_advanced_features(self):
         """Demonstrate advanced features of the system"""
         
         self.console.print("\n🌟 Advanced Features Demonstration")
         
-        features = [
-            {
-                "name": "🤖 AI-Powered Code Generation",
-                "description": "6 specialized AI agents generate production-ready code",
-                "example": "Automatic API endpoint generation with validation & error handling"
-            },
-            {
-                "name": "🔐 Enterprise Security",
-                "description": "JWT authentication, RBAC, rate limiting, security headers",
-                "example": "Auto-configured Auth0 integration with user management"
-            },
-            {
-                "name": "💳 Payment Processing",
-                "description": "Stripe, PayPal, Lemon Squeezy integrations",
-                "example": "Complete checkout flow with subscription management"
-            },
-            {
-                "name": "📊 Real-time Analytics",
-                "description": "Google Analytics, Mixpanel, PostHog integration",
-                "example": "User behavior tracking with conversion funnels"
-            },
-            {
-                "name": "🌍 Global Deployment",
-                "description": "Multi-cloud, multi-region deployment capabilities",
-                "example": "AWS + Kubernetes auto-scaling across 3 regions"
-            },
-            {
-                "name": "🧪 Quality Assurance",
-                "description": "Automated testing, security scanning, performance monitoring",
-                "example": "100% test coverage with E2E scenarios"
-            },
-            {
-                "name": "🎨 Cultural Design",
-                "description": "RTL support, cultural patterns, international fonts",
-                "example": "Arabic marketplace with Islamic geometric patterns"
-            },
-            {
-                "name": "🚀 Performance Optimization",
-                "description": "Image optimization, code splitting, CDN integration",
-                "example": "Sub-second load times with 95+ Lighthouse scores"
-            }
-        ]
-        
-        for feature in features:
-            self.console.print(Panel.fit(
-                f"**{feature['name']}**\n{feature['description']}\n\n💡 Example: {feature['example']}",
+        # Buffer the feature panels and flush once; the old per-panel
+        # print + sleep staged reveal cost ~4s and 8 full renders
+        self._print_section(*[
+            Panel.fit(
+                f"**{name}**\n{description}\n\n💡 Example: {example}",
                 style="blue"
-            ))
-            time.sleep(0.5)
+            )
+            for name, description, example in ADVANCED_FEATURES
+        ])
     
-    def demo_cost_and_value(self):
+    async def demo_cost_and_value(self):
         """Demonstrate the cost-effectiveness and value proposition"""
         
         self.console.print("\n💰 Value Proposition Analysis")
         
-        comparison_table = Table(title="Cost Comparison: Traditional vs +++A Builder", style="green")
-        comparison_table.add_column("Aspect", style="cyan", width=25)
-        comparison_table.add_column("Traditional Agency", style="red", width=25)
-        comparison_table.add_column("+++A Project Builder", style="green", width=25)
-        comparison_table.add_column("Savings", style="yellow", width=15)
-        
-        comparisons = [
-            ["Development Time", "3-6 months", "1-2 days", "95% faster"],
-            ["Cost", "$50,000 - $200,000", "$100 - $500", "99% cheaper"],
-            ["Team Size", "5-10 developers", "1 person + AI", "90% smaller"],
-            ["Maintenance", "$5,000/month", "$50/month", "99% cheaper"],
-            ["Quality", "Variable", "Enterprise-grade", "Consistent"],
-            ["Updates", "Weeks to deploy", "Minutes to deploy", "1000x faster"],
-            ["Scalability", "Manual scaling", "Auto-scaling", "Infinite"],
-            ["Security", "Manual audits", "Built-in security", "24/7 protection"]
-        ]
-        
-        for comparison in comparisons:
-            comparison_table.add_row(*comparison)
-        
+        comparison_table = self._make_table(
+            self.console, "Cost Comparison: Traditional vs +++A Builder", "green",
+            (("Aspect", "cyan", 25), ("Traditional Agency", "red", 25),
+             ("+++A Project Builder", "green", 25), ("Savings", "yellow", 15)),
+            COST_COMPARISONS,
+        )
         self.console.print(comparison_table)
         
         # ROI Analysis
@@ -371,10 +438,10 @@ The most advanced AI-powered project generation system capable of building:
         
         # Welcome and architecture overview
         self.display_welcome()
-        time.sleep(2)
+        await asyncio.sleep(2)
         
         self.display_system_architecture()
-        time.sleep(2)
+        await asyncio.sleep(2)
         
         # Demo project generation
         demo_projects = [
@@ -382,23 +449,39 @@ The most advanced AI-powered project generation system capable of building:
             "Create an Arabic e-commerce marketplace 'Souq Digital' with RTL support, payment processing, vendor management, and cultural design elements"
         ]
         
+        # The two generations are independent (pure simulation + local
+        # lookups), so run them concurrently instead of back to back. Each
+        # task renders into its own capture console; the captured output is
+        # replayed in order afterwards so the tables never interleave.
+        # asyncio.gather rather than TaskGroup keeps the Python >=3.9
+        # floor in setup.py.
+        generations = []
         for i, project in enumerate(demo_projects, 1):
+            capture = Console(
+                file=io.StringIO(),
+                force_terminal=self.console.is_terminal,
+                width=self.console.width,
+            )
+            generations.append((i, capture, self.demo_project_generation(project, console=capture)))
+        results = await asyncio.gather(*(coro for _, _, coro in generations))
+
+        for (i, capture, _), result in zip(generations, results):
             self.console.print(f"\n{'='*80}")
             self.console.print(f"🎯 DEMO PROJECT {i}: COMPLETE GENERATION PROCESS")
             self.console.print(f"{'='*80}")
-            
-            configs = await self.demo_project_generation(project)
-            
+
+            self.console.file.write(capture.file.getvalue())
+
             project_name = f"demo-project-{i}"
-            self.demo_file_generation(project_name, configs)
-            
-            time.sleep(1)
+            self.demo_file_generation(project_name, result)
+
+            await asyncio.sleep(1)
         
         # Advanced features
-        self.demo_advanced_features()
+        await self.demo_advanced_features()
         
         # Cost and value analysis
-        self.demo_cost_and_value()
+        await self.demo_cost_and_value()
         
         # Final summary
         self.console.print(Panel.fit("""
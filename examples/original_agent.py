@@ -7,7 +7,8 @@ Agent.py – Autonomous $5 M product studio
 - Bills ~1 ¢ per 1 k tokens vs Cursor’s ~6 ¢
 """
 from __future__ import annotations
-import os, json, subprocess, shutil, tempfile, textwrap, sys, re, time
+import ast, asyncio, hashlib, os, json, shlex, subprocess, shutil, tempfile, textwrap, sys, re, time
+from collections import deque
 from pathlib import Path
 from typing import List, Dict, Union
 import openai, anthropic, yaml, jinja2, docker
@@ -59,25 +60,44 @@ OPENAI_MODELS = {
 # Prepare for multi-agent system
 class MultiAgentSystem:
     def __init__(self):
-        self.agents = {
-            'architect': self.initialize_agent('architect'),
-            'frontend': self.initialize_agent('frontend'),
-            'backend': self.initialize_agent('backend'),
-            'database': self.initialize_agent('database'),
-            'deployment': self.initialize_agent('deployment')
-        }
-
-    def initialize_agent(self, role):
-        # Initialize agent with specific role
-        return openai.OpenAI(model=OPENAI_MODELS[role])
+        # One shared client pair for every role: the model is chosen per
+        # request, so there is no reason to hold a client per agent.
+        self.client = openai.OpenAI()
+        self.async_client = openai.AsyncOpenAI()
 
     def execute_task(self, role, task):
-        agent = self.agents.get(role)
-        if agent:
-            return agent.chat.completions.create(
-                model=OPENAI_MODELS[role], messages=task, max_tokens=MAX_TOKENS, temperature=TEMPERATURE
+        if role not in OPENAI_MODELS:
+            return "Error: Agent not found for role " + role
+        return self.client.chat.completions.create(
+            model=OPENAI_MODELS[role], messages=task, max_tokens=MAX_TOKENS, temperature=TEMPERATURE
+        )
+
+    async def execute_tasks(self, jobs: Dict[str, list]) -> Dict[str, str]:
+        """Fan out one LLM request per role and gather the results.
+
+        Each role produces an independent artifact, so firing them
+        concurrently makes total planning latency max(role latencies)
+        instead of their sum. Failed roles come back as their exception
+        message rather than aborting the whole scatter.
+        """
+        async def _one(role, msgs):
+            if role not in OPENAI_MODELS:
+                return role, "Error: Agent not found for role " + role
+            response = await self.async_client.chat.completions.create(
+                model=OPENAI_MODELS[role], messages=msgs, max_tokens=MAX_TOKENS, temperature=TEMPERATURE
             )
-        return "Error: Agent not found for role " + role
+            return role, response.choices[0].message.content or ""
+
+        results = await asyncio.gather(
+            *[_one(role, msgs) for role, msgs in jobs.items()], return_exceptions=True
+        )
+        out = {}
+        for role, result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                out[role] = f"Error: {result}"
+            else:
+                out[result[0]] = result[1]
+        return out
 
 multi_agent_system = MultiAgentSystem()
 
@@ -86,44 +106,107 @@ def banner(msg): console.print(Markdown(f"# {msg}"))
 def sh(cmd:str, cwd:Path=None) -> str:
     if cwd is None:
         cwd = Path('.')
-    proc = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=cwd)
+    # exec the command directly instead of going through /bin/sh -c; that
+    # skips one fork+exec per call, which adds up over an agent session
+    try:
+        proc = subprocess.run(shlex.split(cmd), capture_output=True, text=True, cwd=cwd)
+    except (OSError, ValueError) as e:
+        return str(e)
     return proc.stdout + proc.stderr
 
+async def sh_async(cmd:str, cwd:Path=None) -> str:
+    """Async variant of sh() for callers on the event loop; lets independent
+    commands (e.g. test runners over several subdirectories) overlap."""
+    if cwd is None:
+        cwd = Path('.')
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *shlex.split(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
+        )
+    except (OSError, ValueError) as e:
+        return str(e)
+    out, err = await proc.communicate()
+    return out.decode(errors="ignore") + err.decode(errors="ignore")
+
 # Ensure correct message format for LLM
 ChatCompletionMessageParam = Union[Dict[str, str], str]  # Adjust as per actual expected type
 
-# Update llm function to handle message type
+# Role -> prompt prefix for providers that take a flat prompt (Gemini)
+ROLE_PREFIX = {"system": "System: ", "user": "User: ", "assistant": "Assistant: "}
+
+# One function per provider; the active one is bound once at import instead
+# of re-branching on LLM_PROVIDER for every call. Cross-cutting concerns
+# (retries, the client guard) live in llm() so they exist in exactly one place.
+def _llm_openai(messages:List[ChatCompletionMessageParam]) -> str:
+    response = client.chat.completions.create(
+        model=OPENAI_MODEL, messages=messages, max_tokens=MAX_TOKENS, temperature=TEMPERATURE
+    )
+    return response.choices[0].message.content or ""
+
+def _llm_gemini(messages:List[ChatCompletionMessageParam]) -> str:
+    # Convert messages to Gemini format. Build the parts in a list and
+    # join once — repeated str += is quadratic in total prompt size,
+    # which matters for long chat histories.
+    parts = []
+    for msg in messages:
+        prefix = ROLE_PREFIX.get(msg.get("role")) if isinstance(msg, dict) else None
+        if prefix:
+            parts.append(f"{prefix}{msg['content']}\n\n")
+    prompt = "".join(parts)
+
+    response = client.generate(
+        prompt,
+        max_output_tokens=MAX_TOKENS,
+        temperature=TEMPERATURE
+    )
+    return response.text if response.text else ""
+
+def _llm_anthropic(messages:List[ChatCompletionMessageParam]) -> str:
+    response = client.messages.create(
+        model=ANTHROPIC_MODEL, max_tokens=MAX_TOKENS, temperature=TEMPERATURE, messages=messages
+    )
+    return response.content[0].text
+
+PROVIDERS = {"openai": _llm_openai, "gemini": _llm_gemini, "anthropic": _llm_anthropic}
+_llm = PROVIDERS.get(LLM_PROVIDER, _llm_anthropic)
+
+LLM_RETRIES = 3
+
 def llm(messages:List[ChatCompletionMessageParam]) -> str:
     if not client:
         return "Error: LLM client not initialized"
-    
-    if LLM_PROVIDER == "openai":
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL, messages=messages, max_tokens=MAX_TOKENS, temperature=TEMPERATURE
-        )
-        return response.choices[0].message.content or ""
-    elif LLM_PROVIDER == "gemini":
-        # Convert messages to Gemini format
-        prompt = ""
-        for msg in messages:
-            if isinstance(msg, dict) and msg.get("role") == "system":
-                prompt += f"System: {msg['content']}\n\n"
-            elif isinstance(msg, dict) and msg.get("role") == "user":
-                prompt += f"User: {msg['content']}\n\n"
-            elif isinstance(msg, dict) and msg.get("role") == "assistant":
-                prompt += f"Assistant: {msg['content']}\n\n"
-        
-        response = client.generate(
-            prompt,
-            max_output_tokens=MAX_TOKENS,
-            temperature=TEMPERATURE
+    # Retry transient provider failures with exponential backoff; the last
+    # attempt propagates so callers still see hard errors.
+    for attempt in range(LLM_RETRIES):
+        try:
+            return _llm(messages)
+        except Exception:
+            if attempt == LLM_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+async def llm_async(messages:List[ChatCompletionMessageParam]) -> str:
+    """Async wrapper around llm(). The provider SDK calls are blocking, so run
+    them in a worker thread to keep the event loop free for concurrent work."""
+    return await asyncio.to_thread(llm, messages)
+
+async def llm_stream(messages:List[ChatCompletionMessageParam]):
+    """Yield the reply incrementally instead of blocking on the full completion.
+
+    With streaming, callers can start parsing tool calls as soon as they are
+    complete in the buffer rather than waiting out the full MAX_TOKENS
+    response. OpenAI supports token streaming directly; the other providers
+    fall back to a single chunk from the blocking call.
+    """
+    if LLM_PROVIDER == "openai" and client:
+        stream = await openai.AsyncOpenAI().chat.completions.create(
+            model=OPENAI_MODEL, messages=messages, max_tokens=MAX_TOKENS,
+            temperature=TEMPERATURE, stream=True,
         )
-        return response.text if response.text else ""
+        async for chunk in stream:
+            yield chunk.choices[0].delta.content or ""
     else:
-        response = client.messages.create(
-            model=ANTHROPIC_MODEL, max_tokens=MAX_TOKENS, temperature=TEMPERATURE, messages=messages
-        )
-        return response.content[0].text
+        yield await llm_async(messages)
 
 # ---------- TOOLS -----------------------------------------------------------
 class Tools:
@@ -140,17 +223,33 @@ class Tools:
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         Path(path).write_text(content)
 
+    SCAFFOLD_TEMPLATES = {
+        "next": "https://github.com/vercel/next.js/tree/canary/examples/hello-world",
+        "expo": "https://github.com/expo/examples/tree/master/blank",
+        "fastapi": "https://github.com/tiangolo/full-stack-fastapi-template",
+        "django": "https://github.com/wsvincent/django-starter",
+    }
+    SCAFFOLD_CACHE = Path.home() / ".cache" / "project-builder" / "templates"
+
     @staticmethod
     def scaffold(kind:str, dest:str):
-        templates = {
-            "next": "https://github.com/vercel/next.js/tree/canary/examples/hello-world",
-            "expo": "https://github.com/expo/examples/tree/master/blank",
-            "fastapi": "https://github.com/tiangolo/full-stack-fastapi-template",
-            "django": "https://github.com/wsvincent/django-starter",
-        }
-        url = templates.get(kind)
+        url = Tools.SCAFFOLD_TEMPLATES.get(kind)
         if not url: return f"Unknown scaffold {kind}"
-        sh(f"git clone --depth 1 {url} {dest}")
+        # Clone once into a local cache keyed by URL; later scaffolds of the
+        # same template are a directory copy (~100ms) instead of a network
+        # clone. Cached clones are refreshed with a fast-forward pull.
+        cached = Tools.SCAFFOLD_CACHE / hashlib.sha1(url.encode()).hexdigest()
+        if (cached / ".git").exists():
+            sh(f"git -C {cached} pull --ff-only")
+        else:
+            Tools.SCAFFOLD_CACHE.mkdir(parents=True, exist_ok=True)
+            sh(f"git clone --depth 1 {url} {cached}")
+        if (cached / ".git").exists():
+            shutil.copytree(cached, dest, ignore=shutil.ignore_patterns(".git"), dirs_exist_ok=True)
+        else:
+            # Cache clone failed (offline, bad URL); fall back to cloning
+            # straight into the destination.
+            sh(f"git clone --depth 1 {url} {dest}")
         return f"Scaffolded {kind} into {dest}"
 
     @staticmethod
@@ -168,6 +267,20 @@ class Tools:
             if "test" in out.lower(): return out
         return "No test runner detected"
 
+# Compiled once at import: step() matches the same pattern on every reply.
+_TOOL_RE = re.compile(r"(scaffold|write|read|npm|docker_build|run_tests)\((.*?)\)", re.DOTALL)
+
+# Constant-time tool dispatch; arguments are parsed with ast.literal_eval so
+# the model can only pass literals, never execute arbitrary expressions.
+TOOL_DISPATCH = {
+    "scaffold": Tools.scaffold,
+    "write": Tools.write,
+    "read": Tools.read,
+    "npm": Tools.npm,
+    "docker_build": Tools.docker_build,
+    "run_tests": Tools.run_tests,
+}
+
 # ---------- PROMPTS ---------------------------------------------------------
 SYSTEM_PROMPT = """
 You are an elite product engineer.  
@@ -196,13 +309,55 @@ Rules:
 
 # ---------- AUTONOMOUS LOOP -------------------------------------------------
 class Agent:
+    # Keep at most this many recent messages in the prompt; older turns are
+    # folded into a rolling summary. Unbounded history means every turn
+    # resends the whole session — quadratic token cost over a long run.
+    RECENT_TURNS = 20
+    KEEP_AFTER_SUMMARY = 5
+
     def __init__(self, goal:str):
         self.goal = goal
-        self.messages = [{"role":"system","content":SYSTEM_PROMPT},
-                         {"role":"user","content":goal}]
+        self.system = {"role":"system","content":SYSTEM_PROMPT}
+        self.recent = deque(maxlen=self.RECENT_TURNS)
+        self.recent.append({"role":"user","content":goal})
+        self.summary = ""
         self.work = WORK_DIR
         WORK_DIR.mkdir(exist_ok=True)
 
+    @property
+    def messages(self):
+        """Prompt for the next turn: system + rolling summary + recent turns."""
+        msgs = [self.system]
+        if self.summary:
+            msgs.append({"role":"user","content":f"Summary of earlier progress:\n{self.summary}"})
+        msgs.extend(self.recent)
+        return msgs
+
+    def _remember(self, msg:Dict[str,str]):
+        if len(self.recent) == self.recent.maxlen:
+            self._compress_history()
+        self.recent.append(msg)
+
+    def _compress_history(self):
+        """Fold all but the newest turns into the rolling summary."""
+        try:
+            self.summary = llm([
+                {"role":"system","content":"Summarize the following agent conversation, keeping file paths, commands run, and remaining work:"},
+                *self.recent,
+            ])
+        except Exception:
+            pass  # keep the previous summary rather than losing context
+        kept = list(self.recent)[-self.KEEP_AFTER_SUMMARY:]
+        self.recent.clear()
+        self.recent.extend(kept)
+
+    @staticmethod
+    def _run_tool(func:str, args:str) -> str:
+        try:
+            return str(TOOL_DISPATCH[func](*ast.literal_eval(f"({args},)")))
+        except Exception as e:
+            return str(e)
+
     def step(self):
         reply = llm(self.messages)
         console.print(Markdown(reply))
@@ -210,16 +365,37 @@ class Agent:
             return True
 
         # crude tool parser
-        pattern = r"(scaffold|write|read|npm|docker_build|run_tests)\((.*?)\)"
-        for func, args in re.findall(pattern, reply, re.DOTALL):
-            try:
-                result = str(eval(f"Tools.{func}({args})", {'Tools': Tools}))
-            except Exception as e:
-                result = str(e)
-            self.messages.append({"role":"assistant","content":f"{func}({args})"})
-            self.messages.append({"role":"user","content":result})
+        for func, args in _TOOL_RE.findall(reply):
+            result = self._run_tool(func, args)
+            self._remember({"role":"assistant","content":f"{func}({args})"})
+            self._remember({"role":"user","content":result})
         return False
 
+    async def stream_step(self):
+        """Streaming variant of step().
+
+        Consumes llm_stream() chunk by chunk and dispatches each tool call in
+        a background thread as soon as it is complete in the buffer, so tool
+        execution overlaps the rest of the generation instead of waiting for
+        the full response.
+        """
+        buf = ""
+        dispatched = []
+        async for chunk in llm_stream(self.messages):
+            console.print(chunk, end="", markup=False)
+            buf += chunk
+            matches = _TOOL_RE.findall(buf)
+            for func, args in matches[len(dispatched):]:
+                dispatched.append(
+                    (func, args, asyncio.create_task(asyncio.to_thread(self._run_tool, func, args)))
+                )
+        console.print()
+
+        for func, args, task in dispatched:
+            self._remember({"role":"assistant","content":f"{func}({args})"})
+            self._remember({"role":"user","content":await task})
+        return "DONE" in buf.upper()
+
     def run(self):
         banner("🚀 Autonomous Product Studio")
         while not self.step():
@@ -9,18 +9,40 @@ API Integration System for +++A Project Builder 2030
 
 import os
 import json
-import requests
+import sys
+import pickle
 import asyncio
+import logging
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-import stripe
-from rich.console import Console
+from types import MappingProxyType
+from functools import lru_cache
 
-console = Console()
+# rich is only needed when something actually prints; importing it (and
+# running Console()'s terminal detection) at module import would tax every
+# cold start that just wants the registry.
+_console = None
 
-class ServiceType(Enum):
-    """Types of integrated services"""
+
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+logger = logging.getLogger(__name__)
+
+class ServiceType(str, Enum):
+    """Types of integrated services
+
+    A str-backed enum so members are usable directly as strings in
+    templates — no .value descriptor hop per interpolation. str + Enum
+    (rather than enum.StrEnum) keeps the Python >=3.9 floor in setup.py.
+    """
+    __str__ = str.__str__  # interpolate as the value on 3.11+ too
     AUTHENTICATION = "auth"
     PAYMENT = "payment"
     ANALYTICS = "analytics"
@@ -31,7 +53,9 @@ class ServiceType(Enum):
     CDN = "cdn"
     DEPLOYMENT = "deployment"
 
-@dataclass
+# frozen but not slotted: dataclass slots=True needs Python 3.10 and
+# setup.py supports 3.9
+@dataclass(frozen=True)
 class ServiceConfig:
     """Configuration for third-party services"""
     name: str
@@ -41,223 +65,327 @@ class ServiceConfig:
     documentation_url: str
     integration_complexity: str  # 'simple', 'medium', 'complex'
     pricing_model: str
-    features: List[str]
-
-class APIIntegrationManager:
-    """Manages all third-party API integrations"""
-    
-    def __init__(self):
-        self.services = self._initialize_services()
-        self.console = console
-    
-    def _initialize_services(self) -> Dict[str, ServiceConfig]:
-        """Initialize supported third-party services"""
-        return {
-            # Authentication Services
-            "auth0": ServiceConfig(
-                name="Auth0",
-                service_type=ServiceType.AUTHENTICATION,
-                api_key="",
-                endpoint="https://dev-{domain}.auth0.com",
-                documentation_url="https://auth0.com/docs",
-                integration_complexity="medium",
-                pricing_model="freemium",
-                features=["SSO", "Social Login", "MFA", "User Management"]
-            ),
-            "firebase_auth": ServiceConfig(
-                name="Firebase Authentication",
-                service_type=ServiceType.AUTHENTICATION,
-                api_key="",
-                endpoint="https://identitytoolkit.googleapis.com",
-                documentation_url="https://firebase.google.com/docs/auth",
-                integration_complexity="simple",
-                pricing_model="pay_per_use",
-                features=["Email/Password", "Social Login", "Phone Auth", "Anonymous Auth"]
-            ),
-            "clerk": ServiceConfig(
-                name="Clerk",
-                service_type=ServiceType.AUTHENTICATION,
-                api_key="",
-                endpoint="https://api.clerk.dev",
-                documentation_url="https://clerk.com/docs",
-                integration_complexity="simple",
-                pricing_model="freemium",
-                features=["Complete Auth UI", "User Management", "Organizations", "Webhooks"]
-            ),
-            
-            # Payment Services
-            "stripe": ServiceConfig(
-                name="Stripe",
-                service_type=ServiceType.PAYMENT,
-                api_key="",
-                endpoint="https://api.stripe.com",
-                documentation_url="https://stripe.com/docs",
-                integration_complexity="medium",
-                pricing_model="transaction_fee",
-                features=["Payments", "Subscriptions", "Invoicing", "Connect", "Terminal"]
-            ),
-            "paypal": ServiceConfig(
-                name="PayPal",
-                service_type=ServiceType.PAYMENT,
-                api_key="",
-                endpoint="https://api.paypal.com",
-                documentation_url="https://developer.paypal.com/docs",
-                integration_complexity="medium",
-                pricing_model="transaction_fee",
-                features=["Payments", "Subscriptions", "Payouts", "Invoicing"]
-            ),
-            "lemonsqueezy": ServiceConfig(
-                name="Lemon Squeezy",
-                service_type=ServiceType.PAYMENT,
-                api_key="",
-                endpoint="https://api.lemonsqueezy.com",
-                documentation_url="https://docs.lemonsqueezy.com",
-                integration_complexity="simple",
-                pricing_model="transaction_fee",
-                features=["Digital Products", "Subscriptions", "Tax Handling", "Analytics"]
-            ),
-            
-            # Analytics Services
-            "google_analytics": ServiceConfig(
-                name="Google Analytics 4",
-                service_type=ServiceType.ANALYTICS,
-                api_key="",
-                endpoint="https://www.googletagmanager.com",
-                documentation_url="https://developers.google.com/analytics",
-                integration_complexity="medium",
-                pricing_model="free",
-                features=["Web Analytics", "App Analytics", "E-commerce", "Custom Events"]
-            ),
-            "mixpanel": ServiceConfig(
-                name="Mixpanel",
-                service_type=ServiceType.ANALYTICS,
-                api_key="",
-                endpoint="https://api.mixpanel.com",
-                documentation_url="https://developer.mixpanel.com",
-                integration_complexity="simple",
-                pricing_model="freemium",
-                features=["Event Tracking", "User Analytics", "Cohort Analysis", "A/B Testing"]
-            ),
-            "posthog": ServiceConfig(
-                name="PostHog",
-                service_type=ServiceType.ANALYTICS,
-                api_key="",
-                endpoint="https://app.posthog.com",
-                documentation_url="https://posthog.com/docs",
-                integration_complexity="simple",
-                pricing_model="freemium",
-                features=["Product Analytics", "Feature Flags", "Session Replay", "A/B Testing"]
-            ),
-            
-            # Email Services
-            "resend": ServiceConfig(
-                name="Resend",
-                service_type=ServiceType.EMAIL,
-                api_key="",
-                endpoint="https://api.resend.com",
-                documentation_url="https://resend.com/docs",
-                integration_complexity="simple",
-                pricing_model="freemium",
-                features=["Transactional Email", "Marketing Email", "Webhooks", "Analytics"]
-            ),
-            "sendgrid": ServiceConfig(
-                name="SendGrid",
-                service_type=ServiceType.EMAIL,
-                api_key="",
-                endpoint="https://api.sendgrid.com",
-                documentation_url="https://docs.sendgrid.com",
-                integration_complexity="medium",
-                pricing_model="freemium",
-                features=["Email API", "Marketing Campaigns", "Templates", "Analytics"]
-            ),
-            
-            # Storage Services
-            "supabase": ServiceConfig(
-                name="Supabase",
-                service_type=ServiceType.STORAGE,
-                api_key="",
-                endpoint="https://api.supabase.io",
-                documentation_url="https://supabase.com/docs",
-                integration_complexity="simple",
-                pricing_model="freemium",
-                features=["Database", "Storage", "Auth", "Real-time", "Edge Functions"]
-            ),
-            "aws_s3": ServiceConfig(
-                name="AWS S3",
-                service_type=ServiceType.STORAGE,
-                api_key="",
-                endpoint="https://s3.amazonaws.com",
-                documentation_url="https://docs.aws.amazon.com/s3",
-                integration_complexity="complex",
-                pricing_model="pay_per_use",
-                features=["Object Storage", "CDN", "Data Lake", "Backup", "Archive"]
-            ),
-            
-            # Monitoring Services
-            "sentry": ServiceConfig(
-                name="Sentry",
-                service_type=ServiceType.MONITORING,
-                api_key="",
-                endpoint="https://sentry.io/api",
-                documentation_url="https://docs.sentry.io",
-                integration_complexity="simple",
-                pricing_model="freemium",
-                features=["Error Monitoring", "Performance", "Release Health", "Alerts"]
-            ),
-            "datadog": ServiceConfig(
-                name="Datadog",
-                service_type=ServiceType.MONITORING,
-                api_key="",
-                endpoint="https://api.datadoghq.com",
-                documentation_url="https://docs.datadoghq.com",
-                integration_complexity="complex",
-                pricing_model="subscription",
-                features=["Infrastructure", "APM", "Logs", "Synthetics", "Security"]
-            ),
-        }
-    
-    def generate_integration_code(self, service_name: str, project_type: str = "nextjs") -> Dict[str, str]:
-        """Generate integration code for a specific service"""
+    features: tuple
+    # Markdown bullet list of the features, rendered once at construction so
+    # template paths interpolate a ready-made string
+    features_md: str = field(init=False)
+
+    def __post_init__(self):
+        # Intern the small closed vocabularies so equality checks against
+        # them are pointer comparisons and instances share storage
+        object.__setattr__(self, "integration_complexity", sys.intern(self.integration_complexity))
+        object.__setattr__(self, "pricing_model", sys.intern(self.pricing_model))
+        object.__setattr__(self, "features_md", "\n".join(f"- {f}" for f in self.features))
+
+# Supported third-party services, built once at import. Rebuilding ~15
+# ServiceConfig instances per manager construction was pure allocation
+# work for data that never changes.
+def _build_registry() -> Dict[str, ServiceConfig]:
+    return {
+        # Authentication Services
+        "auth0": ServiceConfig(
+            name="Auth0",
+            service_type=ServiceType.AUTHENTICATION,
+            api_key="",
+            endpoint="https://dev-{domain}.auth0.com",
+            documentation_url="https://auth0.com/docs",
+            integration_complexity="medium",
+            pricing_model="freemium",
+            features=("SSO", "Social Login", "MFA", "User Management")
+        ),
+        "firebase_auth": ServiceConfig(
+            name="Firebase Authentication",
+            service_type=ServiceType.AUTHENTICATION,
+            api_key="",
+            endpoint="https://identitytoolkit.googleapis.com",
+            documentation_url="https://firebase.google.com/docs/auth",
+            integration_complexity="simple",
+            pricing_model="pay_per_use",
+            features=("Email/Password", "Social Login", "Phone Auth", "Anonymous Auth")
+        ),
+        "clerk": ServiceConfig(
+            name="Clerk",
+            service_type=ServiceType.AUTHENTICATION,
+            api_key="",
+            endpoint="https://api.clerk.dev",
+            documentation_url="https://clerk.com/docs",
+            integration_complexity="simple",
+            pricing_model="freemium",
+            features=("Complete Auth UI", "User Management", "Organizations", "Webhooks")
+        ),
         
-        if service_name not in self.services:
-            raise ValueError(f"Service {service_name} not supported")
+        # Payment Services
+        "stripe": ServiceConfig(
+            name="Stripe",
+            service_type=ServiceType.PAYMENT,
+            api_key="",
+            endpoint="https://api.stripe.com",
+            documentation_url="https://stripe.com/docs",
+            integration_complexity="medium",
+            pricing_model="transaction_fee",
+            features=("Payments", "Subscriptions", "Invoicing", "Connect", "Terminal")
+        ),
+        "paypal": ServiceConfig(
+            name="PayPal",
+            service_type=ServiceType.PAYMENT,
+            api_key="",
+            endpoint="https://api.paypal.com",
+            documentation_url="https://developer.paypal.com/docs",
+            integration_complexity="medium",
+            pricing_model="transaction_fee",
+            features=("Payments", "Subscriptions", "Payouts", "Invoicing")
+        ),
+        "lemonsqueezy": ServiceConfig(
+            name="Lemon Squeezy",
+            service_type=ServiceType.PAYMENT,
+            api_key="",
+            endpoint="https://api.lemonsqueezy.com",
+            documentation_url="https://docs.lemonsqueezy.com",
+            integration_complexity="simple",
+            pricing_model="transaction_fee",
+            features=("Digital Products", "Subscriptions", "Tax Handling", "Analytics")
+        ),
         
-        service = self.services[service_name]
+        # Analytics Services
+        "google_analytics": ServiceConfig(
+            name="Google Analytics 4",
+            service_type=ServiceType.ANALYTICS,
+            api_key="",
+            endpoint="https://www.googletagmanager.com",
+            documentation_url="https://developers.google.com/analytics",
+            integration_complexity="medium",
+            pricing_model="free",
+            features=("Web Analytics", "App Analytics", "E-commerce", "Custom Events")
+        ),
+        "mixpanel": ServiceConfig(
+            name="Mixpanel",
+            service_type=ServiceType.ANALYTICS,
+            api_key="",
+            endpoint="https://api.mixpanel.com",
+            documentation_url="https://developer.mixpanel.com",
+            integration_complexity="simple",
+            pricing_model="freemium",
+            features=("Event Tracking", "User Analytics", "Cohort Analysis", "A/B Testing")
+        ),
+        "posthog": ServiceConfig(
+            name="PostHog",
+            service_type=ServiceType.ANALYTICS,
+            api_key="",
+            endpoint="https://app.posthog.com",
+            documentation_url="https://posthog.com/docs",
+            integration_complexity="simple",
+            pricing_model="freemium",
+            features=("Product Analytics", "Feature Flags", "Session Replay", "A/B Testing")
+        ),
         
-        self.console.print(f"🔌 Generating {service.name} integration for {project_type}")
+        # Email Services
+        "resend": ServiceConfig(
+            name="Resend",
+            service_type=ServiceType.EMAIL,
+            api_key="",
+            endpoint="https://api.resend.com",
+            documentation_url="https://resend.com/docs",
+            integration_complexity="simple",
+            pricing_model="freemium",
+            features=("Transactional Email", "Marketing Email", "Webhooks", "Analytics")
+        ),
+        "sendgrid": ServiceConfig(
+            name="SendGrid",
+            service_type=ServiceType.EMAIL,
+            api_key="",
+            endpoint="https://api.sendgrid.com",
+            documentation_url="https://docs.sendgrid.com",
+            integration_complexity="medium",
+            pricing_model="freemium",
+            features=("Email API", "Marketing Campaigns", "Templates", "Analytics")
+        ),
         
-        if service_name == "stripe":
-            return self._generate_stripe_integration(project_type)
-        elif service_name == "auth0":
-            return self._generate_auth0_integration(project_type)
-        elif service_name == "firebase_auth":
-            return self._generate_firebase_auth_integration(project_type)
-        elif service_name == "clerk":
-            return self._generate_clerk_integration(project_type)
-        elif service_name == "resend":
-            return self._generate_resend_integration(project_type)
-        elif service_name == "supabase":
-            return self._generate_supabase_integration(project_type)
-        elif service_name == "google_analytics":
-            return self._generate_ga4_integration(project_type)
-        elif service_name == "sentry":
-            return self._generate_sentry_integration(project_type)
-        else:
-            return self._generate_generic_integration(service, project_type)
-    
-    def _generate_stripe_integration(self, project_type: str) -> Dict[str, str]:
-        """Generate Stripe payment integration"""
+        # Storage Services
+        "supabase": ServiceConfig(
+            name="Supabase",
+            service_type=ServiceType.STORAGE,
+            api_key="",
+            endpoint="https://api.supabase.io",
+            documentation_url="https://supabase.com/docs",
+            integration_complexity="simple",
+            pricing_model="freemium",
+            features=("Database", "Storage", "Auth", "Real-time", "Edge Functions")
+        ),
+        "aws_s3": ServiceConfig(
+            name="AWS S3",
+            service_type=ServiceType.STORAGE,
+            api_key="",
+            endpoint="https://s3.amazonaws.com",
+            documentation_url="https://docs.aws.amazon.com/s3",
+            integration_complexity="complex",
+            pricing_model="pay_per_use",
+            features=("Object Storage", "CDN", "Data Lake", "Backup", "Archive")
+        ),
         
-        if project_type == "nextjs":
-            return {
-                "package.json": '''
+        # Monitoring Services
+        "sentry": ServiceConfig(
+            name="Sentry",
+            service_type=ServiceType.MONITORING,
+            api_key="",
+            endpoint="https://sentry.io/api",
+            documentation_url="https://docs.sentry.io",
+            integration_complexity="simple",
+            pricing_model="freemium",
+            features=("Error Monitoring", "Performance", "Release Health", "Alerts")
+        ),
+        "datadog": ServiceConfig(
+            name="Datadog",
+            service_type=ServiceType.MONITORING,
+            api_key="",
+            endpoint="https://api.datadoghq.com",
+            documentation_url="https://docs.datadoghq.com",
+            integration_complexity="complex",
+            pricing_model="subscription",
+            features=("Infrastructure", "APM", "Logs", "Synthetics", "Security")
+        ),
+    }
+
+
+# Deploy pipelines can pre-pickle the registry (see _build_registry) so cold
+# starts deserialize it in one C-level pass instead of running ~15 dataclass
+# constructors; absent or unreadable cache falls back to building it.
+_REGISTRY_PKL = os.path.join(os.path.dirname(__file__), "services.pkl")
+try:
+    with open(_REGISTRY_PKL, "rb") as _fh:
+        _SERVICES_REGISTRY: Dict[str, ServiceConfig] = pickle.load(_fh)
+except (OSError, pickle.PickleError, AttributeError, EOFError):
+    _SERVICES_REGISTRY = _build_registry()
+
+
+# Shared HTTP session for helpers that issue outbound calls. Created on
+# first use (requests stays off the import path) and mounted with a pooling
+# adapter so repeat calls reuse TCP/TLS connections instead of handshaking
+# per request.
+_HTTP_SESSION = None
+
+
+def get_http_session():
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _HTTP_SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _HTTP_SESSION.mount("https://", adapter)
+        _HTTP_SESSION.mount("http://", adapter)
+    return _HTTP_SESSION
+
+
+def use_pooled_stripe_client():
+    """Point the Stripe SDK at the shared pooled session.
+
+    Without this the SDK opens a fresh connection per call; callers that
+    actually talk to Stripe should invoke this once at startup.
+    """
+    import stripe
+    from stripe.http_client import RequestsClient
+
+    if stripe.default_http_client is None:
+        stripe.default_http_client = RequestsClient(session=get_http_session())
+    return stripe.default_http_client
+
+
+# Secondary indices over the registry, built in one pass at import so
+# "all auth services" / "all freemium services" queries are O(1) lookups
+# instead of scanning every ServiceConfig.
+_BY_TYPE: Dict[ServiceType, tuple] = {}
+_BY_PRICING: Dict[str, tuple] = {}
+for _name, _service in _SERVICES_REGISTRY.items():
+    _BY_TYPE.setdefault(_service.service_type, []).append(_name)
+    _BY_PRICING.setdefault(_service.pricing_model, []).append(_name)
+_BY_TYPE = {k: tuple(v) for k, v in _BY_TYPE.items()}
+_BY_PRICING = {k: tuple(v) for k, v in _BY_PRICING.items()}
+del _name, _service
+
+# Curated service recommendations per project type. The table is static, so
+# lookups are memoized below instead of rebuilding the dict on every call.
+_SERVICE_RECOMMENDATIONS = {
+    "saas": (
+        ("auth", ("clerk", "auth0", "firebase_auth")),
+        ("payment", ("stripe", "lemonsqueezy")),
+        ("analytics", ("google_analytics", "posthog", "mixpanel")),
+        ("email", ("resend", "sendgrid")),
+        ("database", ("supabase", "planetscale")),
+        ("monitoring", ("sentry", "datadog")),
+    ),
+    "ecommerce": (
+        ("auth", ("auth0", "clerk")),
+        ("payment", ("stripe", "paypal")),
+        ("analytics", ("google_analytics", "mixpanel")),
+        ("email", ("sendgrid", "resend")),
+        ("storage", ("aws_s3", "supabase")),
+        ("monitoring", ("sentry",)),
+    ),
+    "marketplace": (
+        ("auth", ("auth0", "clerk")),
+        ("payment", ("stripe",)),
+        ("analytics", ("mixpanel", "posthog")),
+        ("email", ("sendgrid",)),
+        ("storage", ("aws_s3",)),
+        ("monitoring", ("sentry", "datadog")),
+    ),
+    "portfolio": (
+        ("analytics", ("google_analytics",)),
+        ("email", ("resend",)),
+        ("storage", ("supabase",)),
+        ("monitoring", ("sentry",)),
+    ),
+}
+
+
+# Guide blocks are fully determined by the registry, so render all of them
+# once at import; guide generation then only does dict lookups.
+_GUIDE_BLOCK_TEMPLATE = """
+### {name}
+- **Type**: {type}
+- **Complexity**: {complexity}
+- **Pricing**: {pricing}
+- **Features**: {features}
+- **Docs**: {docs}
+
+"""
+
+_GUIDE_BLOCKS: Dict[str, str] = {
+    key: _GUIDE_BLOCK_TEMPLATE.format(
+        name=service.name,
+        type=service.service_type.title(),
+        complexity=service.integration_complexity.title(),
+        pricing=service.pricing_model.replace('_', ' ').title(),
+        features=', '.join(service.features),
+        docs=service.documentation_url,
+    )
+    for key, service in _SERVICES_REGISTRY.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _recommended_services(project_type: str, budget: str) -> tuple:
+    """Resolve (project_type, budget) against the static recommendation table.
+
+    budget is part of the cache key so a future budget-aware filter can slot
+    in here without changing callers.
+    """
+    return _SERVICE_RECOMMENDATIONS.get(project_type, ())
+
+
+# Integration file templates, hoisted to module scope so each generator
+# call only pays for one shallow dict copy instead of re-allocating the
+# multi-KB literals. MappingProxyType keeps the shared templates immutable.
+_STRIPE_NEXTJS_FILES = MappingProxyType({
+        "package.json": '''
 {
   "dependencies": {
     "stripe": "^14.0.0",
     "@stripe/stripe-js": "^2.0.0"
   }
 }''',
-                "lib/stripe.ts": '''
+        "lib/stripe.ts": '''
 import Stripe from 'stripe';
 
 export const stripe = new Stripe(process.env.STRIPE_SECRET_KEY!, {
@@ -266,7 +394,7 @@ export const stripe = new Stripe(process.env.STRIPE_SECRET_KEY!, {
 
 export const stripePromise = loadStripe(process.env.NEXT_PUBLIC_STRIPE_PUBLISHABLE_KEY!);
 ''',
-                "pages/api/create-payment-intent.ts": '''
+        "pages/api/create-payment-intent.ts": '''
 import { NextApiRequest, NextApiResponse } from 'next';
 import { stripe } from '../../lib/stripe';
 
@@ -293,7 +421,7 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
   }
 }
 ''',
-                "components/CheckoutForm.tsx": '''
+        "components/CheckoutForm.tsx": '''
 import { useState } from 'react';
 import { loadStripe } from '@stripe/stripe-js';
 import {
@@ -364,12 +492,12 @@ export default function CheckoutPage() {
   );
 }
 ''',
-                ".env.example": '''
+        ".env.example": '''
 STRIPE_SECRET_KEY=sk_test_...
 NEXT_PUBLIC_STRIPE_PUBLISHABLE_KEY=pk_test_...
 STRIPE_WEBHOOK_SECRET=whsec_...
 ''',
-                "README.md": '''
+        "README.md": '''
 # Stripe Integration
 
 ## Setup
@@ -383,27 +511,21 @@ STRIPE_WEBHOOK_SECRET=whsec_...
 - Webhook handling
 - Customer portal
 '''
-            }
-        
-        return {}
-    
-    def _generate_auth0_integration(self, project_type: str) -> Dict[str, str]:
-        """Generate Auth0 authentication integration"""
-        
-        if project_type == "nextjs":
-            return {
-                "package.json": '''
+    })
+
+_AUTH0_NEXTJS_FILES = MappingProxyType({
+        "package.json": '''
 {
   "dependencies": {
     "@auth0/nextjs-auth0": "^3.0.0"
   }
 }''',
-                "pages/api/auth/[...auth0].ts": '''
+        "pages/api/auth/[...auth0].ts": '''
 import { handleAuth } from '@auth0/nextjs-auth0';
 
 export default handleAuth();
 ''',
-                "lib/auth0.ts": '''
+        "lib/auth0.ts": '''
 import { initAuth0 } from '@auth0/nextjs-auth0';
 
 export default initAuth0({
@@ -418,7 +540,7 @@ export default initAuth0({
   },
 });
 ''',
-                "components/LoginButton.tsx": '''
+        "components/LoginButton.tsx": '''
 import { useUser } from '@auth0/nextjs-auth0/client';
 
 export default function LoginButton() {
@@ -446,7 +568,7 @@ export default function LoginButton() {
   );
 }
 ''',
-                ".env.example": '''
+        ".env.example": '''
 AUTH0_DOMAIN=your-domain.auth0.com
 AUTH0_CLIENT_ID=your-client-id
 AUTH0_CLIENT_SECRET=your-client-secret
@@ -454,27 +576,21 @@ AUTH0_COOKIE_SECRET=a-long-random-string
 AUTH0_REDIRECT_URI=http://localhost:3000/api/auth/callback
 AUTH0_POST_LOGOUT_REDIRECT_URI=http://localhost:3000
 '''
-            }
-        
-        return {}
-    
-    def _generate_resend_integration(self, project_type: str) -> Dict[str, str]:
-        """Generate Resend email integration"""
-        
-        if project_type == "nextjs":
-            return {
-                "package.json": '''
+    })
+
+_RESEND_NEXTJS_FILES = MappingProxyType({
+        "package.json": '''
 {
   "dependencies": {
     "resend": "^2.0.0"
   }
 }''',
-                "lib/resend.ts": '''
+        "lib/resend.ts": '''
 import { Resend } from 'resend';
 
 export const resend = new Resend(process.env.RESEND_API_KEY);
 ''',
-                "pages/api/send-email.ts": '''
+        "pages/api/send-email.ts": '''
 import { NextApiRequest, NextApiResponse } from 'next';
 import { resend } from '../../lib/resend';
 
@@ -500,7 +616,7 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
   }
 }
 ''',
-                "components/ContactForm.tsx": '''
+        "components/ContactForm.tsx": '''
 import { useState } from 'react';
 
 export default function ContactForm() {
@@ -574,28 +690,32 @@ export default function ContactForm() {
   );
 }
 ''',
-                ".env.example": '''
+        ".env.example": '''
 RESEND_API_KEY=re_...
 '''
-            }
-        
-        return {}
-    
-    def _generate_generic_integration(self, service: ServiceConfig, project_type: str) -> Dict[str, str]:
-        """Generate generic integration template"""
-        
-        return {
-            "README.md": f'''
+    })
+
+@lru_cache(maxsize=64)
+def _render_generic(service_name: str, project_type: str) -> tuple:
+    """Render the generic integration files for a registered service.
+
+    Every field interpolated here comes from the immutable registry, so the
+    rendered text is a pure function of (service_name, project_type) —
+    memoize it and let repeat builds reuse the strings.
+    """
+    service = _SERVICES_REGISTRY[service_name]
+    return tuple({
+        "README.md": f'''
 # {service.name} Integration
 
 ## Overview
-- **Service Type**: {service.service_type.value}
+- **Service Type**: {service.service_type}
 - **Complexity**: {service.integration_complexity}
 - **Pricing**: {service.pricing_model}
 - **Documentation**: {service.documentation_url}
 
 ## Features
-{chr(10).join(f"- {feature}" for feature in service.features)}
+{service.features_md}
 
 ## Setup
 1. Sign up at {service.documentation_url}
@@ -609,83 +729,125 @@ RESEND_API_KEY=re_...
 {service.name.upper()}_ENDPOINT={service.endpoint}
 ```
 ''',
-            ".env.example": f'''
+        ".env.example": f'''
 {service.name.upper()}_API_KEY=your-api-key
 {service.name.upper()}_ENDPOINT={service.endpoint}
-'''
-        }
+''',
+    }.items())
+
+
+class APIIntegrationManager:
+    """Manages all third-party API integrations"""
+    
+    def __init__(self):
+        self.services = self._initialize_services()
+    
+    def _initialize_services(self) -> Dict[str, ServiceConfig]:
+        """Initialize supported third-party services"""
+        return _SERVICES_REGISTRY
+    
+    def generate_integration_code(self, service_name: str, project_type: str = "nextjs") -> Dict[str, str]:
+        """Generate integration code for a specific service"""
+        
+        # Caller-supplied project types are not guaranteed interned; normalize
+        # once so the per-generator "nextjs" comparisons are pointer equality
+        project_type = sys.intern(project_type)
+
+        # Single probe on the hit path instead of `in` check + lookup
+        try:
+            service = self.services[service_name]
+        except KeyError:
+            raise ValueError(f"Service {service_name} not supported") from None
+        
+        # Library-path logging: lazy %-args mean no string is built when the
+        # level is disabled, and no rich import/render on the hot path
+        logger.info("Generating %s integration for %s", service.name, project_type)
+
+        generator = self._GENERATORS.get(service_name)
+        if generator is not None:
+            return generator(self, project_type)
+        return self._generate_generic_integration(service_name, project_type)
+    
+    def _generate_stripe_integration(self, project_type: str) -> Dict[str, str]:
+        """Generate Stripe payment integration"""
+        return dict(_STRIPE_NEXTJS_FILES) if project_type == "nextjs" else {}
+    
+    def _generate_auth0_integration(self, project_type: str) -> Dict[str, str]:
+        """Generate Auth0 authentication integration"""
+        return dict(_AUTH0_NEXTJS_FILES) if project_type == "nextjs" else {}
     
+    def _generate_resend_integration(self, project_type: str) -> Dict[str, str]:
+        """Generate Resend email integration"""
+        return dict(_RESEND_NEXTJS_FILES) if project_type == "nextjs" else {}
+    
+    # Service name -> dedicated generator; everything else falls back to the
+    # generic template. Hash lookup instead of a branch per service, and
+    # unknown-but-registered services no longer hit missing dedicated
+    # generators (the old if/elif chain referenced several that were never
+    # written).
+    _GENERATORS = {
+        "stripe": _generate_stripe_integration,
+        "auth0": _generate_auth0_integration,
+        "resend": _generate_resend_integration,
+    }
+
+    async def generate_many(self, services: List[str], project_type: str = "nextjs") -> Dict[str, Dict[str, str]]:
+        """Generate several integrations concurrently.
+
+        Today's generators are CPU-light template copies, but routing the
+        fan-out through asyncio.gather means callers stay O(slowest) once
+        generators start issuing real HTTP (key validation, scaffold
+        downloads) instead of O(sum).
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.generate_integration_code, s, project_type) for s in services)
+        )
+        return dict(zip(services, results))
+
+    def _generate_generic_integration(self, service_name: str, project_type: str) -> Dict[str, str]:
+        """Generate generic integration template"""
+        # Fresh dict per call (callers mutate their copy) over cached,
+        # immutable rendered pairs.
+        return dict(_render_generic(service_name, project_type))
+    
+    def services_by_type(self, service_type: ServiceType) -> tuple:
+        """All registered service names of the given type (precomputed)."""
+        return _BY_TYPE.get(service_type, ())
+
+    def services_by_pricing(self, pricing_model: str) -> tuple:
+        """All registered service names with the given pricing model (precomputed)."""
+        return _BY_PRICING.get(pricing_model, ())
+
     def get_recommended_services(self, project_type: str, budget: str = "startup") -> Dict[str, List[str]]:
         """Get recommended services for a project type and budget"""
-        
-        recommendations = {
-            "saas": {
-                "auth": ["clerk", "auth0", "firebase_auth"],
-                "payment": ["stripe", "lemonsqueezy"],
-                "analytics": ["google_analytics", "posthog", "mixpanel"],
-                "email": ["resend", "sendgrid"],
-                "database": ["supabase", "planetscale"],
-                "monitoring": ["sentry", "datadog"]
-            },
-            "ecommerce": {
-                "auth": ["auth0", "clerk"],
-                "payment": ["stripe", "paypal"],
-                "analytics": ["google_analytics", "mixpanel"],
-                "email": ["sendgrid", "resend"],
-                "storage": ["aws_s3", "supabase"],
-                "monitoring": ["sentry"]
-            },
-            "marketplace": {
-                "auth": ["auth0", "clerk"],
-                "payment": ["stripe"],
-                "analytics": ["mixpanel", "posthog"],
-                "email": ["sendgrid"],
-                "storage": ["aws_s3"],
-                "monitoring": ["sentry", "datadog"]
-            },
-            "portfolio": {
-                "analytics": ["google_analytics"],
-                "email": ["resend"],
-                "storage": ["supabase"],
-                "monitoring": ["sentry"]
-            }
+        return {
+            service_type: list(services)
+            for service_type, services in _recommended_services(project_type, budget)
         }
-        
-        # Filter by budget
-        if budget == "startup":
-            # Prefer free/freemium services
-            budget_filter = ["freemium", "free", "pay_per_use"]
-        elif budget == "business":
-            budget_filter = ["freemium", "subscription", "transaction_fee"]
-        else:  # enterprise
-            budget_filter = ["subscription", "enterprise", "transaction_fee"]
-        
-        return recommendations.get(project_type, {})
     
     def generate_integration_guide(self, services: List[str], project_type: str) -> str:
         """Generate complete integration guide for multiple services"""
         
-        guide = f"""
+        # Collect the blocks and join once — repeated str += re-copies the
+        # accumulated guide on every service.
+        parts = [f"""
 # API Integration Guide for {project_type.title()} Project
 
 ## Services Integration Plan
 
-"""
-        
+"""]
+
+        # Skip duplicates and unknown names; known services get their block
+        # pre-rendered at import.
+        seen = set()
         for service_name in services:
-            if service_name in self.services:
-                service = self.services[service_name]
-                guide += f"""
-### {service.name}
-- **Type**: {service.service_type.value.title()}
-- **Complexity**: {service.integration_complexity.title()}
-- **Pricing**: {service.pricing_model.replace('_', ' ').title()}
-- **Features**: {', '.join(service.features)}
-- **Docs**: {service.documentation_url}
+            block = _GUIDE_BLOCKS.get(service_name)
+            if block is None or service_name in seen:
+                continue
+            seen.add(service_name)
+            parts.append(block)
 
-"""
-        
-        guide += """
+        parts.append("""
 ## Integration Steps
 
 1. **Setup Environment Variables**
@@ -726,12 +888,13 @@ RESEND_API_KEY=re_...
 - Set up CORS properly
 - Regular security audits
 
-"""
-        
-        return guide
+""")
+
+        return "".join(parts)
 
 # Example usage
 if __name__ == "__main__":
+    console = _get_console()
     manager = APIIntegrationManager()
     
     # Get recommendations for a SaaS project
@@ -26,23 +26,79 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 sys.path.append(str(Path(__file__).parent / "core"))
 sys.path.append(str(Path(__file__).parent / "integrations"))
 
-from multi_agent_system import MultiAgentOrchestrator
-from tech_stack_upgrader import ModernTechStackManager
-from core.openrouter_client import OpenRouterClient
+# The orchestrator/tech-stack/OpenRouter imports pull in the openai and
+# anthropic SDKs; they're deferred to ProjectBuilder2030.__init__ so --help
+# and argument errors stay instantaneous
 
 console = Console()
 
+# Static wizard options, shared by the pre-rendered form and answer parsing
+PROJECT_TYPES = [
+    "SaaS Platform",
+    "E-commerce/Marketplace",
+    "Portfolio/Showcase",
+    "Enterprise Application",
+    "Mobile App",
+    "Other"
+]
+
+COMPLEXITY_LEVELS = ["Simple", "Medium", "Complex", "Enterprise"]
+
+BUDGET_LEVELS = ["Startup ($0-10K)", "Business ($10K-100K)", "Enterprise ($100K+)"]
+
+SPECIAL_REQUIREMENTS = [
+    ("internationalization", "🌍 International/cultural support (RTL, i18n)"),
+    ("3d_graphics", "🎨 3D/immersive graphics"),
+    ("payments", "💳 Payment processing"),
+    ("analytics", "📊 Analytics/monitoring"),
+    ("mobile", "📱 Mobile app")
+]
+
+
+def _render_requirements_form() -> str:
+    """Build the full question sheet as one static block.
+
+    Printing the whole form up front and then reading bare answers avoids a
+    Rich render + readline round-trip per question, which dominates the
+    pre-LLM latency on slow terminals like VS Code's integrated one.
+    """
+    lines = ["\n📋 Let's gather your project requirements:\n"]
+
+    lines.append("📊 Project types:")
+    for i, ptype in enumerate(PROJECT_TYPES, 1):
+        lines.append(f"  {i}. {ptype}")
+
+    lines.append("\n🔧 Complexity levels:")
+    for i, level in enumerate(COMPLEXITY_LEVELS, 1):
+        lines.append(f"  {i}. {level}")
+
+    lines.append("\n💰 Budget levels:")
+    for i, budget in enumerate(BUDGET_LEVELS, 1):
+        lines.append(f"  {i}. {budget}")
+
+    lines.append("\n✨ Special requirements (answer with comma-separated numbers, or leave empty):")
+    for i, (_, label) in enumerate(SPECIAL_REQUIREMENTS, 1):
+        lines.append(f"  {i}. {label}")
+
+    return "\n".join(lines)
+
+
 class ProjectBuilder2030:
     """Main interface for the +++A Project Builder 2030"""
     
     def __init__(self):
+        from multi_agent_system import MultiAgentOrchestrator
+        from tech_stack_upgrader import ModernTechStackManager
+        from core.openrouter_client import get_openrouter_client
+
         self.console = console
         self.orchestrator = MultiAgentOrchestrator()
         self.tech_manager = ModernTechStackManager()
-        
-        # Initialize OpenRouter client for cost tracking
+
+        # Shared OpenRouter client — same instance the agents use, so the
+        # cost summary actually reflects their requests
         try:
-            self.openrouter_client = OpenRouterClient()
+            self.openrouter_client = get_openrouter_client()
             self.cost_tracking_enabled = True
         except Exception as e:
             self.console.print(f"⚠️  OpenRouter not configured: {e}", style="yellow")
@@ -81,72 +137,38 @@ Transform your ideas into production-ready frontend applications with AI
         self.console.print(Panel.fit(welcome_text, style="bold green", title="🎯 WELCOME"))
     
     def get_project_requirements(self) -> Dict[str, Any]:
-        """Interactive project requirement gathering"""
-        
-        self.console.print("\n📋 Let's gather your project requirements:")
-        
+        """Interactive project requirement gathering.
+
+        The static menus are printed as one block up front; the answer pass
+        only reads input, so there is a single Rich render for the whole
+        wizard instead of one per question.
+        """
+        self.console.print(_render_requirements_form())
+
         # Basic project info
         project_name = Prompt.ask("🏷️  Project name", default="my-awesome-project")
         project_description = Prompt.ask("📝 Project description (detailed)")
-        
-        # Project type
-        project_types = [
-            "SaaS Platform",
-            "E-commerce/Marketplace", 
-            "Portfolio/Showcase",
-            "Enterprise Application",
-            "Mobile App",
-            "Other"
-        ]
-        
-        self.console.print("\n📊 Select project type:")
-        for i, ptype in enumerate(project_types, 1):
-            self.console.print(f"  {i}. {ptype}")
-        
-        type_choice = Prompt.ask("Choose type (1-6)", choices=[str(i) for i in range(1, 7)])
-        project_type = project_types[int(type_choice) - 1].lower().replace(" ", "_").replace("/", "_")
-        
-        # Complexity level
-        complexity_levels = ["Simple", "Medium", "Complex", "Enterprise"]
-        self.console.print("\n🔧 Select complexity level:")
-        for i, level in enumerate(complexity_levels, 1):
-            self.console.print(f"  {i}. {level}")
-        
-        complexity_choice = Prompt.ask("Choose complexity (1-4)", choices=[str(i) for i in range(1, 5)])
-        complexity = complexity_levels[int(complexity_choice) - 1].lower()
-        
-        # Budget level
-        budget_levels = ["Startup ($0-10K)", "Business ($10K-100K)", "Enterprise ($100K+)"]
-        self.console.print("\n💰 Select budget level:")
-        for i, budget in enumerate(budget_levels, 1):
-            self.console.print(f"  {i}. {budget}")
-        
-        budget_choice = Prompt.ask("Choose budget (1-3)", choices=[str(i) for i in range(1, 4)])
-        budget = budget_levels[int(budget_choice) - 1].split()[0].lower()
-        
-        # Features
-        self.console.print("\n🎯 Required features (comma-separated):")
-        features_input = Prompt.ask("Features", default="user authentication, dashboard, api integration")
+
+        type_choice = Prompt.ask("📊 Project type (1-6)", choices=[str(i) for i in range(1, 7)])
+        project_type = PROJECT_TYPES[int(type_choice) - 1].lower().replace(" ", "_").replace("/", "_")
+
+        complexity_choice = Prompt.ask("🔧 Complexity (1-4)", choices=[str(i) for i in range(1, 5)])
+        complexity = COMPLEXITY_LEVELS[int(complexity_choice) - 1].lower()
+
+        budget_choice = Prompt.ask("💰 Budget (1-3)", choices=[str(i) for i in range(1, 4)])
+        budget = BUDGET_LEVELS[int(budget_choice) - 1].split()[0].lower()
+
+        features_input = Prompt.ask("🎯 Features (comma-separated)", default="user authentication, dashboard, api integration")
         features = [f.strip() for f in features_input.split(",")]
-        
-        # Special requirements
+
+        # One multi-select answer replaces five yes/no round-trips
+        special_input = Prompt.ask("✨ Special requirements (e.g. 1,3)", default="")
         special_requirements = []
-        
-        if Confirm.ask("🌍 Need international/cultural support (RTL, i18n)?"):
-            special_requirements.append("internationalization")
-        
-        if Confirm.ask("🎨 Need 3D/immersive graphics?"):
-            special_requirements.append("3d_graphics")
-        
-        if Confirm.ask("💳 Need payment processing?"):
-            special_requirements.append("payments")
-        
-        if Confirm.ask("📊 Need analytics/monitoring?"):
-            special_requirements.append("analytics")
-        
-        if Confirm.ask("📱 Need mobile app?"):
-            special_requirements.append("mobile")
-        
+        for token in special_input.split(","):
+            token = token.strip()
+            if token.isdigit() and 1 <= int(token) <= len(SPECIAL_REQUIREMENTS):
+                special_requirements.append(SPECIAL_REQUIREMENTS[int(token) - 1][0])
+
         return {
             "name": project_name,
             "description": project_description,
@@ -8,6 +8,18 @@ import os
 from typing import Dict, Any, List, Optional, Type
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_spec(spec: Dict[str, Any]) -> bytes:
+    """Serialize a template spec to indented JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(spec, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(spec, indent=2, default=str).encode("utf-8")
+
 from templates import (
     BaseTemplate,
     SAASProjectTemplate,
@@ -109,18 +121,47 @@ class TemplateManager:
         """Export template specification to JSON file."""
         try:
             spec = self.get_template_spec(template)
-            with open(output_path, 'w') as f:
-                json.dump(spec, f, indent=2, default=str)
+            Path(output_path).write_bytes(_dump_spec(spec))
             return True
         except Exception as e:
             print(f"Error exporting template spec: {e}")
             return False
     
+    def export_template_specs(self, exports: List[tuple]) -> List[bool]:
+        """Export several template specifications in one batch.
+
+        Takes (template, output_path) pairs, serializes every spec up front,
+        then performs all file writes in a single pass so per-template
+        serialization errors never leave a half-written batch behind.
+        """
+        serialized = []
+        for template, output_path in exports:
+            try:
+                spec = self.get_template_spec(template)
+                serialized.append((output_path, _dump_spec(spec)))
+            except Exception as e:
+                print(f"Error exporting template spec: {e}")
+                serialized.append(None)
+
+        results = []
+        for item in serialized:
+            if item is None:
+                results.append(False)
+                continue
+            output_path, payload = item
+            try:
+                Path(output_path).write_bytes(payload)
+                results.append(True)
+            except Exception as e:
+                print(f"Error exporting template spec: {e}")
+                results.append(False)
+        return results
+
     def import_template_spec(self, spec_path: str) -> Optional[Dict[str, Any]]:
         """Import template specification from JSON file."""
         try:
-            with open(spec_path, 'r') as f:
-                return json.load(f)
+            data = Path(spec_path).read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except Exception as e:
             print(f"Error importing template spec: {e}")
             return None
@@ -11,9 +11,11 @@ Version: 2.0.0 - Ultra Pro Edition
 
 import os
 import sys
+import io
 import json
 import asyncio
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
@@ -22,7 +24,7 @@ from enum import Enum
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress, TextColumn
 from rich.markdown import Markdown
 from rich.columns import Columns
 from rich.text import Text
@@ -30,20 +32,74 @@ from rich.text import Text
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils.ollama_client import OllamaClient
-from agents.conversation_agent import ConversationAgent
-from agents.design_preview_agent import DesignPreviewAgent
-from agents.content_writer_agent import ContentWriterAgent
-from agents.ultimate_builder_agent import UltimateBuilderAgent
-from agents.quality_assurance_agent import QualityAssuranceAgent
-from design_system.professional_design_system import ProfessionalDesignSystem
-from design_system.component_library import ComponentLibrary
-from design_system.template_system import UltimateTemplateSystem
-from conversation_flows.industry_flows import IndustryFlowManager
-from performance.optimization_system import PerformanceOptimizationSystem
+# Agent and design-system modules are imported inside
+# UltimateWebsiteBuilder.__init__ — they pull in the whole pipeline, and the
+# welcome/abort paths shouldn't pay for them
 
 console = Console()
 
+
+@lru_cache(maxsize=1)
+def _render_ultimate_welcome() -> str:
+    """Render the static welcome banner to an ANSI string, once.
+
+    Markup parsing and panel/table layout run on the first call only;
+    displaying the banner afterwards is a plain stdout write.
+    """
+    welcome_banner = """
+🚀 ULTIMATE WEBSITE BUILDER - Professional Edition
+
+Transform your vision into agency-quality websites through natural conversation.
+From simple descriptions to stunning professional websites in minutes.
+
+✨ Features:
+• Natural conversation interface - just describe your vision
+• Professional design system with agency-quality aesthetics
+• Industry-specific templates and expertise
+• Real-time design previews and customization
+• Conversion-optimized content and copy
+• Mobile-first responsive design
+• 90+ Lighthouse performance scores
+• WCAG AA accessibility compliance
+• SEO-ready structure and optimization
+• Production-ready deployment configs
+
+🎯 Perfect for: Restaurants • Portfolios • Businesses • E-commerce • Blogs • Corporate Sites
+    """
+
+    buffer_console = Console(file=io.StringIO(), force_terminal=console.is_terminal)
+
+    buffer_console.print(Panel(
+        welcome_banner,
+        title="🎨 Welcome to the Ultimate Website Builder",
+        border_style="bold magenta",
+        padding=(1, 2)
+    ))
+
+    capabilities_table = Table(title="🏆 Professional Capabilities", show_header=True, header_style="bold cyan")
+    capabilities_table.add_column("Feature", style="green", width=25)
+    capabilities_table.add_column("Professional Standard", style="white", width=50)
+
+    capabilities = [
+        ("Design Quality", "Agency-level aesthetics with sophisticated typography and color palettes"),
+        ("Content Creation", "Conversion-optimized copy with industry-specific expertise"),
+        ("Performance", "90+ Lighthouse scores with Core Web Vitals optimization"),
+        ("Accessibility", "WCAG AA compliance with full keyboard navigation support"),
+        ("SEO Optimization", "Semantic HTML, structured data, and search engine ready"),
+        ("Mobile Experience", "Mobile-first responsive design with touch-friendly interactions"),
+        ("Code Quality", "Production-ready TypeScript with comprehensive error handling"),
+        ("Industry Expertise", "Specialized knowledge for restaurants, portfolios, and businesses")
+    ]
+
+    for feature, standard in capabilities:
+        capabilities_table.add_row(feature, standard)
+
+    buffer_console.print(capabilities_table)
+    buffer_console.print()
+
+    return buffer_console.file.getvalue()
+
+
 class IndustryType(Enum):
     RESTAURANT = "restaurant"
     PORTFOLIO = "portfolio"
@@ -78,6 +134,18 @@ class UltimateWebsiteBuilder:
     """The Ultimate Professional Website Builder - Agency-Quality Results"""
     
     def __init__(self):
+        from utils.ollama_client import OllamaClient
+        from agents.conversation_agent import ConversationAgent
+        from agents.design_preview_agent import DesignPreviewAgent
+        from agents.content_writer_agent import ContentWriterAgent
+        from agents.ultimate_builder_agent import UltimateBuilderAgent
+        from agents.quality_assurance_agent import QualityAssuranceAgent
+        from design_system.professional_design_system import ProfessionalDesignSystem
+        from design_system.component_library import ComponentLibrary
+        from design_system.template_system import UltimateTemplateSystem
+        from conversation_flows.industry_flows import IndustryFlowManager
+        from performance.optimization_system import PerformanceOptimizationSystem
+
         self.console = Console()
         self.ollama_client = OllamaClient()
         self.design_system = ProfessionalDesignSystem()
@@ -102,57 +170,15 @@ class UltimateWebsiteBuilder:
         ]
         
     def display_ultimate_welcome(self):
-        """Display the ultimate professional welcome experience"""
-        welcome_banner = """
-🚀 ULTIMATE WEBSITE BUILDER - Professional Edition
+        """Display the ultimate professional welcome experience.
 
-Transform your vision into agency-quality websites through natural conversation.
-From simple descriptions to stunning professional websites in minutes.
-
-✨ Features:
-• Natural conversation interface - just describe your vision
-• Professional design system with agency-quality aesthetics  
-• Industry-specific templates and expertise
-• Real-time design previews and customization
-• Conversion-optimized content and copy
-• Mobile-first responsive design
-• 90+ Lighthouse performance scores
-• WCAG AA accessibility compliance
-• SEO-ready structure and optimization
-• Production-ready deployment configs
-
-🎯 Perfect for: Restaurants • Portfolios • Businesses • E-commerce • Blogs • Corporate Sites
+        The banner is entirely static, so it is rendered to ANSI once and
+        cached; repeat displays are a single stdout write with no Rich
+        markup parsing or panel layout work.
         """
-        
-        self.console.print(Panel(
-            welcome_banner,
-            title="🎨 Welcome to the Ultimate Website Builder",
-            border_style="bold magenta",
-            padding=(1, 2)
-        ))
-        
-        # Display professional capabilities
-        capabilities_table = Table(title="🏆 Professional Capabilities", show_header=True, header_style="bold cyan")
-        capabilities_table.add_column("Feature", style="green", width=25)
-        capabilities_table.add_column("Professional Standard", style="white", width=50)
-        
-        capabilities = [
-            ("Design Quality", "Agency-level aesthetics with sophisticated typography and color palettes"),
-            ("Content Creation", "Conversion-optimized copy with industry-specific expertise"),
-            ("Performance", "90+ Lighthouse scores with Core Web Vitals optimization"),
-            ("Accessibility", "WCAG AA compliance with full keyboard navigation support"),
-            ("SEO Optimization", "Semantic HTML, structured data, and search engine ready"),
-            ("Mobile Experience", "Mobile-first responsive design with touch-friendly interactions"),
-            ("Code Quality", "Production-ready TypeScript with comprehensive error handling"),
-            ("Industry Expertise", "Specialized knowledge for restaurants, portfolios, and businesses")
-        ]
-        
-        for feature, standard in capabilities:
-            capabilities_table.add_row(feature, standard)
-        
-        self.console.print(capabilities_table)
-        self.console.print()
-        
+        sys.stdout.write(_render_ultimate_welcome())
+        sys.stdout.flush()
+
     async def start_natural_conversation(self) -> Optional[Dict[str, Any]]:
         """Start the natural conversation flow to gather requirements"""
         self.console.print("[bold green]🎯 Let's create your professional website![/bold green]")
@@ -254,10 +280,13 @@ Key Features:
         """Generate professional, conversion-optimized content"""
         self.console.print("\n[bold green]✍️ Creating Professional Content...[/bold green]")
         
+        # No SpinnerColumn: the spinner forces timer-driven redraws every
+        # frame; a low refresh rate with just the description is enough for
+        # one coarse task
         with Progress(
-            SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
+            refresh_per_second=4,
         ) as progress:
             task = progress.add_task("Generating conversion-optimized content...", total=None)
             
@@ -330,9 +359,21 @@ Key Features:
         return project_path
     
     def display_qa_results(self, qa_results: Dict[str, Any]):
-        """Display comprehensive QA results"""
+        """Display comprehensive QA results.
+
+        The whole screen is rendered into one capture buffer and written in
+        a single flush — per-print rendering re-parses markup and syscalls
+        on every call, which is what makes multi-panel screens feel slow on
+        heavy terminals.
+        """
+        with self.console.capture() as capture:
+            self._render_qa_results(qa_results)
+        sys.stdout.write(capture.get())
+        sys.stdout.flush()
+
+    def _render_qa_results(self, qa_results: Dict[str, Any]):
         self.console.print("\n[bold green]🔍 Quality Assurance Results:[/bold green]")
-        
+
         # Overall score
         overall_score = qa_results.get("overall_score", 0)
         score_color = "green" if overall_score >= 90 else "yellow" if overall_score >= 75 else "red"
@@ -359,7 +400,13 @@ Key Features:
                 self.console.print(f"• {rec}")
     
     def display_completion_summary(self, project_path: str, qa_results: Dict[str, Any]):
-        """Display the ultimate completion summary"""
+        """Display the ultimate completion summary in one buffered flush."""
+        with self.console.capture() as capture:
+            self._render_completion_summary(project_path, qa_results)
+        sys.stdout.write(capture.get())
+        sys.stdout.flush()
+
+    def _render_completion_summary(self, project_path: str, qa_results: Dict[str, Any]):
         self.console.print("\n[bold green]🎉 Your Professional Website is Ready![/bold green]")
         
         # Success metrics
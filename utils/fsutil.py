@@ -0,0 +1,46 @@
+"""Fast project-tree enumeration shared by the pipeline agents.
+
+os.walk stats every entry a second time to classify it; os.scandir returns
+DirEntry objects that already carry is_file()/is_dir() from the directory
+read, roughly halving syscalls on large generated trees. The skip list keeps
+the walkers out of node_modules and build output, which can dwarf the actual
+source tree.
+"""
+
+import os
+from typing import Iterator, Tuple
+
+# Directories no agent should descend into: dependency and build output
+SKIP_DIRS = frozenset({"node_modules", ".next", ".git", "dist", "build"})
+
+
+def iter_entries(root: str) -> Iterator[Tuple[str, bool]]:
+    """Yield (path, is_dir) for every entry under root, depth-first.
+
+    Skips SKIP_DIRS and never follows symlinks. Unreadable directories and
+    entries that vanish mid-scan are silently skipped, matching the
+    best-effort behavior of the os.walk loops this replaces.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in SKIP_DIRS:
+                        continue
+                    yield entry.path, True
+                    yield from iter_entries(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, False
+            except OSError:
+                continue
+
+
+def iter_source_files(root: str) -> Iterator[str]:
+    """Yield file paths under root, skipping SKIP_DIRS."""
+    for path, is_dir in iter_entries(root):
+        if not is_dir:
+            yield path
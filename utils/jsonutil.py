@@ -0,0 +1,30 @@
+"""JSON helpers backed by orjson when available, stdlib json otherwise.
+
+The agents shuttle large JSON blobs around every run — technical specs and
+review reports measured in tens of KB, plus the NDJSON event stream from
+Ollama. orjson parses and serializes these several times faster than the
+pure-Python stdlib encoder; the stdlib fallback keeps the package working
+without it.
+
+Both loads implementations raise a ValueError subclass on malformed input,
+so callers should catch ValueError rather than json.JSONDecodeError.
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj, indent: bool = False) -> str:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+
+except ImportError:
+    import json as _json
+
+    def loads(data):
+        return _json.loads(data)
+
+    def dumps(obj, indent: bool = False) -> str:
+        return _json.dumps(obj, indent=2 if indent else None)
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+
+
+class FileBackend:
+    """Stores cached responses as one JSON file per key under a cache directory."""
+
+    def __init__(self, cache_dir: str = ".cache/llm"):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, entry: dict):
+        try:
+            with open(self._path(key), "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+        except OSError:
+            # Cache writes are best-effort; never fail the generation path
+            pass
+
+
+class LLMCache:
+    """Deterministic on-disk cache for LLM responses.
+
+    Only deterministic requests (temperature == 0) are cacheable — sampled
+    responses are intentionally different between runs. Keys are the SHA-256
+    of the canonical JSON payload, so identical (model, prompt, system,
+    options) requests hit regardless of which agent issued them.
+    """
+
+    def __init__(self, backend: FileBackend, ttl_seconds: int = 86400):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(model: str, prompt: str, system: Optional[str] = None,
+                  temperature: float = 0.0, max_tokens: Optional[int] = None) -> Optional[str]:
+        """Return the cache key for a request, or None if it is not cacheable."""
+        if temperature > 0:
+            return None
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "system": system,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        blob = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        entry = self.backend.get(key)
+        if entry is None or (time.time() - entry.get("ts", 0)) > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.get("response")
+
+    def set(self, key: Optional[str], response: str):
+        if key is None or not response:
+            return
+        self.backend.set(key, {"ts": time.time(), "response": response})
@@ -1,44 +1,91 @@
 import requests
 import json
 import time
+from utils import jsonutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from rich.console import Console
 
 console = Console()
 
+
+@lru_cache(maxsize=32)
+def _model_available(api_url: str, model_name: str) -> bool:
+    """Memoized model-availability lookup, one /api/tags hit per model.
+
+    The set of local models only changes when a pull runs, so every agent
+    sharing a model can answer from this cache instead of independently
+    polling the daemon. pull_model clears the cache after a successful pull.
+    """
+    try:
+        response = requests.get(f"{api_url}/tags", timeout=10)
+        if response.status_code == 200:
+            models = response.json().get("models", [])
+            return any(model["name"].startswith(model_name) for model in models)
+        return False
+    except requests.exceptions.RequestException:
+        return False
+
+
 class OllamaClient:
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(self, base_url: str = "http://localhost:11434", cache=None):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
+        # Optional LLMCache (utils.llm_cache) — deterministic requests are
+        # served from disk on reruns, skipping network + inference entirely
+        self.cache = cache
+        # One pooled keep-alive session for all sync HTTP. Module-level
+        # requests.get/post would open a fresh TCP connection per call; with
+        # every agent sharing this client, that adds up over a pipeline run
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Shared aiohttp session for async generation; created lazily so
+        # sync-only callers never pay for it
+        self._async_session = None
+
+    def close(self):
+        """Close the pooled sync session (async callers use aclose())."""
+        self._session.close()
     
     def is_model_available(self, model_name: str) -> bool:
-        """Check if a model is available locally."""
-        try:
-            response = requests.get(f"{self.api_url}/tags", timeout=10)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                return any(model["name"].startswith(model_name) for model in models)
-            return False
-        except requests.exceptions.RequestException:
-            return False
+        """Check if a model is available locally (memoized per process)."""
+        return _model_available(self.api_url, model_name)
     
-    def pull_model(self, model_name: str) -> bool:
-        """Pull a model from the Ollama registry."""
+    def pull_model(self, model_name: str, on_progress=None) -> bool:
+        """Pull a model from the Ollama registry.
+
+        `on_progress(completed, total)` is invoked with real downloaded byte
+        counts from the pull event stream, so callers can drive an actual
+        progress bar instead of an idle spinner.
+        """
         try:
             console.print(f"[yellow]Pulling model {model_name}...[/yellow]")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/pull",
                 json={"name": model_name},
                 stream=True,
                 timeout=600  # 10 minute timeout for model downloads
             )
-            
+
             if response.status_code == 200:
+                last_status = None
                 for line in response.iter_lines():
                     if line:
-                        data = json.loads(line.decode('utf-8'))
-                        if "status" in data:
-                            console.print(f"[blue]{data['status']}[/blue]")
+                        data = jsonutil.loads(line)
+                        # The stream repeats each status with updated byte
+                        # counts; only print when the phase changes
+                        status = data.get("status")
+                        if status and status != last_status:
+                            console.print(f"[blue]{status}[/blue]")
+                            last_status = status
+                        if on_progress and data.get("total"):
+                            on_progress(data.get("completed", 0), data["total"])
+                # The local model set changed; drop memoized availability
+                # answers so the next check sees the new model
+                _model_available.cache_clear()
                 return True
             return False
         except requests.exceptions.RequestException as e:
@@ -53,6 +100,15 @@ class OllamaClient:
             if max_tokens and max_tokens > 8000:
                 console.print(f"[yellow]Warning: Large token count ({max_tokens}) may cause timeouts. Using 8000.[/yellow]")
                 max_tokens = 8000
+
+            # Serve deterministic requests from the cache before any HTTP work
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.cache_key(model, prompt, system, temperature, max_tokens)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    console.print(f"[dim]Cache hit for {model} ({len(cached)} characters)[/dim]")
+                    return cached
             
             payload = {
                 "model": model,
@@ -79,7 +135,7 @@ class OllamaClient:
             
             for timeout in timeouts:
                 try:
-                    response = requests.post(
+                    response = self._session.post(
                         f"{self.api_url}/generate",
                         json=payload,
                         timeout=timeout
@@ -91,6 +147,8 @@ class OllamaClient:
                         
                         if response_text.strip():
                             console.print(f"[green]✅ Generated {len(response_text)} characters[/green]")
+                            if self.cache is not None:
+                                self.cache.set(cache_key, response_text)
                             return response_text
                         else:
                             console.print("[yellow]Warning: Empty response received[/yellow]")
@@ -113,16 +171,146 @@ class OllamaClient:
             console.print(f"[red]Unexpected error in generate: {e}[/red]")
             return None
     
-    def generate_response(self, model: str, prompt: str, max_tokens: Optional[int] = None, 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _get_async_session(self):
+        """Create the shared keep-alive session on first use."""
+        if self._async_session is None:
+            import aiohttp
+            self._async_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=300),
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=300),
+            )
+        return self._async_session
+
+    async def aclose(self):
+        """Close the shared async session."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    async def generate_async(self, model: str, prompt: str, system: Optional[str] = None,
+                             temperature: float = 0.7, max_tokens: Optional[int] = None) -> Optional[str]:
+        """Async generate sharing one keep-alive connection pool.
+
+        Concurrent agent calls reuse pooled connections instead of re-dialing,
+        and the event loop stays free to tick progress displays while the
+        model generates. Open the client with `async with OllamaClient() as c`
+        (or call aclose() when done) so the pool is shut down cleanly.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.cache_key(model, prompt, system, temperature, max_tokens)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                console.print(f"[dim]Cache hit for {model} ({len(cached)} characters)[/dim]")
+                return cached
+
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": temperature,
+                "top_p": 0.9,
+                "top_k": 40,
+                "repeat_penalty": 1.1
+            }
+        }
+        if system:
+            payload["system"] = system
+        if max_tokens:
+            payload["options"]["num_ctx"] = max_tokens
+
+        session = self._get_async_session()
+        try:
+            async with session.post(f"{self.api_url}/generate", json=payload) as response:
+                if response.status != 200:
+                    console.print(f"[red]Error: {response.status} - {await response.text()}[/red]")
+                    return None
+                result = await response.json()
+                response_text = result.get("response", "")
+                if not response_text.strip():
+                    console.print("[yellow]Warning: Empty response received[/yellow]")
+                    return None
+                if self.cache is not None:
+                    self.cache.set(cache_key, response_text)
+                return response_text
+        except Exception as e:
+            console.print(f"[red]Async request failed: {e}[/red]")
+            return None
+
+    async def generate_stream(self, model: str, prompt: str, system: Optional[str] = None,
+                              temperature: float = 0.7, max_tokens: Optional[int] = None):
+        """Stream the response incrementally via /api/generate stream mode.
+
+        Yields text chunks as Ollama decodes them, so callers can start acting
+        on early output (e.g. writing completed files to disk) while the rest
+        of the response is still generating.
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "top_p": 0.9,
+                "top_k": 40,
+                "repeat_penalty": 1.1
+            }
+        }
+        if system:
+            payload["system"] = system
+        if max_tokens:
+            payload["options"]["num_ctx"] = max_tokens
+
+        session = self._get_async_session()
+        async with session.post(f"{self.api_url}/generate", json=payload) as response:
+            if response.status != 200:
+                console.print(f"[red]Error: {response.status} - {await response.text()}[/red]")
+                return
+            async for line in response.content:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = jsonutil.loads(line)
+                except ValueError:
+                    continue
+                chunk = data.get("response", "")
+                if chunk:
+                    yield chunk
+                if data.get("done"):
+                    break
+
+    def generate_response(self, model: str, prompt: str, max_tokens: Optional[int] = None,
                          temperature: float = 0.7) -> str:
         """Generate response for orchestrator (synchronous version)."""
         result = self.generate(model, prompt, temperature=temperature, max_tokens=max_tokens)
         return result if result else ""
     
+    def embed(self, model: str, text: str) -> Optional[list]:
+        """Get an embedding vector for the given text."""
+        try:
+            response = self._session.post(
+                f"{self.api_url}/embeddings",
+                json={"model": model, "prompt": text},
+                timeout=60
+            )
+            if response.status_code == 200:
+                return response.json().get("embedding")
+            return None
+        except requests.exceptions.RequestException:
+            return None
+
     def list_models(self) -> list:
         """List all available models."""
         try:
-            response = requests.get(f"{self.api_url}/tags", timeout=10)
+            response = self._session.get(f"{self.api_url}/tags", timeout=10)
             if response.status_code == 200:
                 return response.json().get("models", [])
             return []
@@ -178,7 +366,7 @@ class OllamaClient:
                 }
             }
             
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/chat",
                 json=payload,
                 timeout=300
@@ -207,20 +395,36 @@ class OllamaClient:
     
     def ensure_models_available(self, models: list) -> bool:
         """Ensure all required models are available, pull if necessary."""
+        missing = [model for model in models if not self.is_model_available(model)]
+
         for model in models:
-            if not self.is_model_available(model):
+            if model in missing:
+                continue
+            console.print(f"[green]Model {model} is available[/green]")
+
+            # Test model response
+            console.print(f"[dim]Testing {model} response capability...[/dim]")
+            if not self.test_model_response(model):
+                console.print(f"[yellow]Warning: {model} may not be responding properly[/yellow]")
+                console.print(f"[yellow]Consider re-pulling: ollama pull {model}[/yellow]")
+
+        if missing:
+            # Pull missing models concurrently — downloads are network-bound,
+            # so total wall time is max(pull) rather than sum(pull)
+            for model in missing:
                 console.print(f"[yellow]Model {model} not found locally. Pulling...[/yellow]")
-                if not self.pull_model(model):
+
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                results = list(executor.map(self.pull_model, missing))
+
+            success = True
+            for model, pulled in zip(missing, results):
+                if pulled:
+                    console.print(f"[green]Successfully pulled {model}[/green]")
+                else:
                     console.print(f"[red]Failed to pull model {model}[/red]")
-                    return False
-                console.print(f"[green]Successfully pulled {model}[/green]")
-            else:
-                console.print(f"[green]Model {model} is available[/green]")
-                
-                # Test model response
-                console.print(f"[dim]Testing {model} response capability...[/dim]")
-                if not self.test_model_response(model):
-                    console.print(f"[yellow]Warning: {model} may not be responding properly[/yellow]")
-                    console.print(f"[yellow]Consider re-pulling: ollama pull {model}[/yellow]")
-        
+                    success = False
+            if not success:
+                return False
+
         return True
\ No newline at end of file
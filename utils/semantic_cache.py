@@ -0,0 +1,97 @@
+import json
+import math
+import os
+from typing import Callable, List, Optional
+
+from rich.console import Console
+
+console = Console()
+
+EMBEDDING_MODEL = "nomic-embed-text"
+
+
+class SemanticCache:
+    """Similarity cache that reuses prior pipeline outputs for paraphrased prompts.
+
+    Exact-match caching misses when a project spec is slightly reworded even
+    though the resulting plan would be identical. This cache embeds each spec,
+    keeps the normalized vectors alongside the cached value (a file path), and
+    on lookup returns the value of the most similar prior spec when cosine
+    similarity clears the threshold.
+
+    The index is a plain JSON file of normalized vectors — the corpus is tens
+    of entries, so a linear scan with a dot product is faster than any index
+    structure would ever pay for.
+    """
+
+    def __init__(self, embed_fn: Callable[[str], Optional[List[float]]],
+                 store_path: str = ".cache/semantic/index.json",
+                 threshold: float = 0.92):
+        self.embed_fn = embed_fn
+        self.store_path = store_path
+        self.threshold = threshold
+        self._entries = self._load()
+
+    def _load(self) -> list:
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return []
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.store_path), exist_ok=True)
+            with open(self.store_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+        except OSError:
+            # Best-effort persistence; in-memory entries still work this run
+            pass
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> Optional[List[float]]:
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0:
+            return None
+        return [v / norm for v in vector]
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        try:
+            vector = self.embed_fn(text)
+        except Exception:
+            return None
+        if not vector:
+            return None
+        return self._normalize(vector)
+
+    def lookup(self, text: str) -> Optional[str]:
+        """Return the cached value for the most similar prior text, or None."""
+        if not self._entries:
+            return None
+        query = self._embed(text)
+        if query is None:
+            return None
+
+        best_score = -1.0
+        best_value = None
+        for entry in self._entries:
+            vector = entry.get("vector")
+            if not vector or len(vector) != len(query):
+                continue
+            score = sum(a * b for a, b in zip(query, vector))
+            if score > best_score:
+                best_score = score
+                best_value = entry.get("value")
+
+        if best_score >= self.threshold:
+            console.print(f"[dim]Semantic cache hit (similarity {best_score:.3f})[/dim]")
+            return best_value
+        return None
+
+    def store(self, text: str, value: str):
+        """Record text -> value so similar future texts can reuse the value."""
+        vector = self._embed(text)
+        if vector is None:
+            return
+        self._entries.append({"vector": vector, "value": value})
+        self._save()
@@ -0,0 +1,40 @@
+"""Token-budget-aware batching for multi-item LLM prompts.
+
+One call per file wastes prefill re-encoding the shared system prompt;
+stuffing everything into one prompt blows the context window. Packing items
+greedily up to a token budget amortizes the static prompt across many small
+files while keeping each call within bounds. Without a tokenizer dependency,
+sizes are estimated at ~4 characters per token, which is close enough for
+budgeting code and JSON.
+"""
+
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting: ~4 characters per token."""
+    return max(1, len(text) // 4)
+
+
+def pack(items: Iterable[T], max_tokens: int,
+         text_of: Callable[[T], str] = str) -> Iterator[List[T]]:
+    """Yield lists of items whose combined estimated tokens stay in budget.
+
+    Greedy first-fit in input order. An item that alone exceeds the budget
+    is yielded as its own batch rather than dropped — callers already
+    truncate oversized content downstream.
+    """
+    batch: List[T] = []
+    batch_tokens = 0
+    for item in items:
+        item_tokens = estimate_tokens(text_of(item))
+        if batch and batch_tokens + item_tokens > max_tokens:
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(item)
+        batch_tokens += item_tokens
+    if batch:
+        yield batch
@@ -0,0 +1,218 @@
+"""OpenAI-compatible vLLM backend with the same interface as OllamaClient.
+
+Ollama serializes generation requests at the server boundary, so client-side
+concurrency (batched reviews, parallel agents) queues up behind a single
+sequence. vLLM's continuous batching scheduler actually runs overlapping
+requests together. Launch it with, e.g.:
+
+    vllm serve deepseek-ai/deepseek-coder-33b-instruct --max-num-seqs 32
+
+and select the backend with LLM_BACKEND=vllm (default remains ollama).
+"""
+
+import requests
+import json
+from typing import Optional, Dict, Any
+from rich.console import Console
+
+console = Console()
+
+class VLLMClient:
+    def __init__(self, base_url: str = "http://localhost:8000", cache=None):
+        self.base_url = base_url
+        self.api_url = f"{base_url}/v1"
+        # Optional LLMCache (utils.llm_cache), same contract as OllamaClient
+        self.cache = cache
+        self._async_session = None
+
+    def _build_messages(self, prompt: str, system: Optional[str]) -> list:
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def is_model_available(self, model_name: str) -> bool:
+        """Check if the vLLM server is serving the given model."""
+        try:
+            response = requests.get(f"{self.api_url}/models", timeout=10)
+            if response.status_code == 200:
+                models = response.json().get("data", [])
+                return any(model["id"].startswith(model_name) for model in models)
+            return False
+        except requests.exceptions.RequestException:
+            return False
+
+    def list_models(self) -> list:
+        """List all models served by the vLLM instance."""
+        try:
+            response = requests.get(f"{self.api_url}/models", timeout=10)
+            if response.status_code == 200:
+                return response.json().get("data", [])
+            return []
+        except requests.exceptions.RequestException:
+            return []
+
+    def generate(self, model: str, prompt: str, system: Optional[str] = None,
+                 temperature: float = 0.7, max_tokens: Optional[int] = None) -> Optional[str]:
+        """Generate a response via the OpenAI-compatible chat completions API."""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.cache_key(model, prompt, system, temperature, max_tokens)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                console.print(f"[dim]Cache hit for {model} ({len(cached)} characters)[/dim]")
+                return cached
+
+        payload = {
+            "model": model,
+            "messages": self._build_messages(prompt, system),
+            "temperature": temperature,
+        }
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+
+        try:
+            console.print(f"[dim]Generating response with {model} via vLLM (temp: {temperature})[/dim]")
+            response = requests.post(
+                f"{self.api_url}/chat/completions",
+                json=payload,
+                timeout=600
+            )
+            if response.status_code != 200:
+                console.print(f"[red]Error: {response.status_code} - {response.text}[/red]")
+                return None
+
+            result = response.json()
+            response_text = result["choices"][0]["message"]["content"]
+            if not response_text.strip():
+                console.print("[yellow]Warning: Empty response received[/yellow]")
+                return None
+
+            console.print(f"[green]✅ Generated {len(response_text)} characters[/green]")
+            if self.cache is not None:
+                self.cache.set(cache_key, response_text)
+            return response_text
+
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]Request failed: {e}[/red]")
+            return None
+        except (KeyError, IndexError, json.JSONDecodeError) as e:
+            console.print(f"[red]Unexpected vLLM response format: {e}[/red]")
+            return None
+
+    async def generate_async(self, model: str, prompt: str, system: Optional[str] = None,
+                             temperature: float = 0.7, max_tokens: Optional[int] = None) -> Optional[str]:
+        """Async generate sharing one keep-alive connection pool.
+
+        With vLLM this is where the throughput win lives: concurrent calls
+        are continuously batched server-side instead of queueing.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.cache_key(model, prompt, system, temperature, max_tokens)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                console.print(f"[dim]Cache hit for {model} ({len(cached)} characters)[/dim]")
+                return cached
+
+        payload = {
+            "model": model,
+            "messages": self._build_messages(prompt, system),
+            "temperature": temperature,
+        }
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+
+        session = self._get_async_session()
+        try:
+            async with session.post(f"{self.api_url}/chat/completions", json=payload) as response:
+                if response.status != 200:
+                    console.print(f"[red]Error: {response.status} - {await response.text()}[/red]")
+                    return None
+                result = await response.json()
+                response_text = result["choices"][0]["message"]["content"]
+                if not response_text.strip():
+                    console.print("[yellow]Warning: Empty response received[/yellow]")
+                    return None
+                if self.cache is not None:
+                    self.cache.set(cache_key, response_text)
+                return response_text
+        except Exception as e:
+            console.print(f"[red]Async request failed: {e}[/red]")
+            return None
+
+    def _get_async_session(self):
+        """Create the shared keep-alive session on first use."""
+        if self._async_session is None:
+            import aiohttp
+            self._async_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=600),
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=300),
+            )
+        return self._async_session
+
+    async def aclose(self):
+        """Close the shared async session."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def generate_response(self, model: str, prompt: str, max_tokens: Optional[int] = None,
+                          temperature: float = 0.7) -> str:
+        """Generate response for orchestrator (synchronous version)."""
+        result = self.generate(model, prompt, temperature=temperature, max_tokens=max_tokens)
+        return result if result else ""
+
+    def chat(self, model: str, messages: list, temperature: float = 0.7) -> Optional[str]:
+        """Chat with a model using conversation format."""
+        try:
+            response = requests.post(
+                f"{self.api_url}/chat/completions",
+                json={"model": model, "messages": messages, "temperature": temperature},
+                timeout=300
+            )
+            if response.status_code == 200:
+                return response.json()["choices"][0]["message"]["content"]
+            console.print(f"[red]Error: {response.status_code} - {response.text}[/red]")
+            return None
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]Request failed: {e}[/red]")
+            return None
+
+    def embed(self, model: str, text: str) -> Optional[list]:
+        """Get an embedding vector for the given text."""
+        try:
+            response = requests.post(
+                f"{self.api_url}/embeddings",
+                json={"model": model, "input": text},
+                timeout=60
+            )
+            if response.status_code == 200:
+                data = response.json().get("data", [])
+                return data[0].get("embedding") if data else None
+            return None
+        except requests.exceptions.RequestException:
+            return None
+
+    def ensure_models_available(self, models: list) -> bool:
+        """Verify all required models are served.
+
+        vLLM serves a fixed set of models chosen at launch — there is no pull
+        equivalent, so missing models are reported with the launch command.
+        """
+        all_available = True
+        for model in models:
+            if self.is_model_available(model):
+                console.print(f"[green]Model {model} is available[/green]")
+            else:
+                console.print(f"[red]Model {model} is not served by vLLM[/red]")
+                console.print(f"[yellow]Launch it with: vllm serve {model} --max-num-seqs 32[/yellow]")
+                all_available = False
+        return all_available